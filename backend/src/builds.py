@@ -0,0 +1,185 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+import uuid
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Set
+
+from fastapi.encoders import jsonable_encoder
+from slugify import slugify
+
+from src.models import CreateAppPayload
+
+TEMPLATE_PATH: Path = Path("/app/src/template")
+BUILDS_PATH: Path = Path("/app/builds")
+# Build directories kept around for reuse, least recently used ones go first
+BUILDS_MAX_COUNT = int(os.getenv("BUILDS_MAX_COUNT", "20"))
+# Models a build downloads at the same time, overall and per host ("*" for
+# hosts not listed). Civitai throttles parallel downloads harder than
+# huggingface does. Passed to the template through config.py.
+MODEL_DOWNLOAD_CONCURRENCY = int(os.getenv("MODEL_DOWNLOAD_CONCURRENCY", "4"))
+MODEL_HOST_DOWNLOAD_CONCURRENCY = os.getenv(
+    "MODEL_HOST_DOWNLOAD_CONCURRENCY", "civitai.com=2,huggingface.co=4,*=2")
+# Scratch directories older than this belong to a build that never finished
+STALE_TMP_SECONDS = 3600
+# A running deploy touches its build directory this often, and directories
+# touched more recently than BUILD_IN_USE_SECONDS are never pruned. Pruning
+# only knows its own worker's deploys, this keeps other workers' ones safe.
+BUILD_HEARTBEAT_SECONDS = 60
+BUILD_IN_USE_SECONDS = 5 * BUILD_HEARTBEAT_SECONDS
+TMP_PREFIX = ".tmp-"
+
+logger = logging.getLogger(__name__)
+
+
+def render_build_files(payload: CreateAppPayload) -> Dict[str, bytes]:
+    # Files generated for a deploy on top of the template, by relative path
+    config = {
+        "machine_name": slugify(payload.machine_name),
+        "gpu": payload.gpu.value,
+        "additional_dependencies": payload.additional_dependencies,
+        "idle_timeout": payload.idle_timeout,
+        "download_concurrency": max(1, MODEL_DOWNLOAD_CONCURRENCY),
+        "host_download_concurrency": parse_host_limits(
+            MODEL_HOST_DOWNLOAD_CONCURRENCY),
+    }
+    return {
+        "config.py": ("config = " + json.dumps(config)).encode("utf-8"),
+        "custom_nodes.json": json.dumps(
+            jsonable_encoder(payload.custom_nodes), indent=4).encode("utf-8"),
+        "models.json": json.dumps(
+            jsonable_encoder(payload.models), indent=4).encode("utf-8"),
+    }
+
+
+def parse_host_limits(value: str) -> Dict[str, int]:
+    # "civitai.com=2,*=2" -> {"civitai.com": 2, "*": 2}
+    limits = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        host, _, limit = item.partition("=")
+        limits[host.strip()] = max(1, int(limit))
+    return limits
+
+
+@lru_cache(maxsize=None)
+def template_version() -> str:
+    # Hash of every file in the template, computed once per process since the
+    # template only changes with a new release
+    digest = hashlib.sha256()
+    for path in sorted(TEMPLATE_PATH.rglob("*")):
+        if path.is_file() and "__pycache__" not in path.parts:
+            digest.update(str(path.relative_to(TEMPLATE_PATH)).encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(path.read_bytes())
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def build_id(files: Dict[str, bytes]) -> str:
+    # Identical payloads on the same template share a build directory
+    digest = hashlib.sha256(template_version().encode("utf-8"))
+    for name in sorted(files):
+        digest.update(name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(hashlib.sha256(files[name]).digest())
+    return digest.hexdigest()[:32]
+
+
+async def prepare_build_dir(build: str, files: Dict[str, bytes]) -> Path:
+    # File system work happens on a thread so it doesn't stall the event loop
+    return await asyncio.to_thread(_prepare_build_dir, build, files)
+
+
+def _prepare_build_dir(build: str, files: Dict[str, bytes]) -> Path:
+    folder_path = BUILDS_PATH / build
+    if folder_path.exists():
+        # Mark as recently used so pruning keeps it around
+        os.utime(folder_path)
+        return folder_path
+
+    # Build in a scratch directory and rename it into place, so a directory
+    # named after the build id is always complete
+    BUILDS_PATH.mkdir(parents=True, exist_ok=True)
+    tmp_path = BUILDS_PATH / f"{TMP_PREFIX}{build}-{uuid.uuid4().hex}"
+    try:
+        _materialize_template(tmp_path, skip=set(files))
+        for name, content in files.items():
+            path = tmp_path / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(content)
+        os.rename(tmp_path, folder_path)
+    except OSError:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        if not folder_path.exists():
+            raise
+    return folder_path
+
+
+async def keep_build_in_use(folder_path: Path):
+    # Runs for as long as a deploy uses the build directory
+    while True:
+        await asyncio.sleep(BUILD_HEARTBEAT_SECONDS)
+        try:
+            await asyncio.to_thread(os.utime, folder_path)
+        except OSError as e:
+            logger.warning("Unable to mark %s as in use: %s", folder_path, e)
+
+
+def _materialize_template(target: Path, skip: Set[str]):
+    # Template files are hardlinked into the build where the file system
+    # allows it, copied otherwise. Generated files are skipped here, writing
+    # them through a hardlink would overwrite the template itself.
+    for dirpath, dirnames, filenames in os.walk(TEMPLATE_PATH):
+        dirnames[:] = [d for d in dirnames if d != "__pycache__"]
+        src_dir = Path(dirpath)
+        dest_dir = target / src_dir.relative_to(TEMPLATE_PATH)
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        for filename in filenames:
+            src = src_dir / filename
+            if str(src.relative_to(TEMPLATE_PATH)) in skip:
+                continue
+            try:
+                os.link(src, dest_dir / filename)
+            except OSError:
+                shutil.copy2(src, dest_dir / filename)
+
+
+def prune_builds(keep: Iterable[str] = ()):
+    # Drop the least recently used build directories past BUILDS_MAX_COUNT.
+    # Builds in `keep` or touched within BUILD_IN_USE_SECONDS are in use and
+    # never removed.
+    in_use = set(keep)
+    try:
+        entries = [path for path in BUILDS_PATH.iterdir() if path.is_dir()]
+    except FileNotFoundError:
+        return
+
+    now = time.time()
+    builds = []
+    for path in entries:
+        try:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            continue
+        if path.name.startswith(TMP_PREFIX):
+            # Leftovers of a build interrupted by a crash or restart
+            if now - mtime > STALE_TMP_SECONDS:
+                shutil.rmtree(path, ignore_errors=True)
+        elif path.name in in_use or now - mtime < BUILD_IN_USE_SECONDS:
+            in_use.add(path.name)
+        else:
+            builds.append((mtime, path))
+
+    excess = len(builds) + len(in_use) - BUILDS_MAX_COUNT
+    if excess <= 0:
+        return
+    for _, path in sorted(builds)[:excess]:
+        logger.info("Removing unused build directory %s", path)
+        shutil.rmtree(path, ignore_errors=True)
@@ -0,0 +1,355 @@
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import AsyncIterator, List, Optional, Tuple
+
+from src.models import DeployState, LogLine
+
+logger = logging.getLogger(__name__)
+
+# How often a worker looks for new lines of a deploy running elsewhere
+STORE_POLL_INTERVAL = float(os.getenv("DEPLOY_STORE_POLL_SECONDS", "0.5"))
+# Lines read from the store in one go while following a deploy
+READ_BATCH_SIZE = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS deploys (
+    deploy_id TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    closed INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id TEXT PRIMARY KEY,
+    deploy_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tasks_deploy_id ON tasks (deploy_id);
+CREATE TABLE IF NOT EXISTS log_lines (
+    deploy_id TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    event_type TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    message TEXT NOT NULL,
+    PRIMARY KEY (deploy_id, id)
+);
+"""
+
+
+class DeployStore(ABC):
+    """Deploy status and logs shared between backend workers.
+
+    The worker running a deploy serves it from memory and mirrors it into
+    the store, where every other worker finds it. Deploys are identified by
+    the task id of the request that started them, coalesced requests get
+    their own task id pointing at the same deploy.
+    """
+
+    # Whether other workers see what is saved here. Deploys aren't mirrored
+    # into a store that doesn't share them.
+    shared = True
+
+    async def open(self):
+        pass
+
+    async def close(self):
+        pass
+
+    @abstractmethod
+    async def add_task(self, task_id: str, deploy_id: str):
+        raise NotImplementedError
+
+    @abstractmethod
+    async def save(self, deploy_id: str, state: DeployState,
+                   lines: List[LogLine], closed: bool = False):
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_state(self, task_id: str) -> Optional[DeployState]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def read_lines(self, task_id: str,
+                         after_id: int) -> Tuple[List[LogLine], bool]:
+        # Lines after `after_id` and whether the deploy has finished
+        raise NotImplementedError
+
+    @abstractmethod
+    async def evict(self, deploy_id: str):
+        raise NotImplementedError
+
+    async def follow(self, task_id: str,
+                     after_id: int = 0) -> AsyncIterator[LogLine]:
+        while True:
+            lines, closed = await self.read_lines(task_id, after_id)
+            for line in lines:
+                yield line
+            if lines:
+                after_id = lines[-1].id
+                continue
+            if closed:
+                return
+            await asyncio.sleep(STORE_POLL_INTERVAL)
+
+
+class MemoryDeployStore(DeployStore):
+    """Keeps nothing beyond what the running worker already has in memory.
+
+    Deploys are only visible to the worker that started them, which is all a
+    single worker setup needs.
+    """
+
+    shared = False
+
+    async def add_task(self, task_id: str, deploy_id: str):
+        pass
+
+    async def save(self, deploy_id: str, state: DeployState,
+                   lines: List[LogLine], closed: bool = False):
+        pass
+
+    async def get_state(self, task_id: str) -> Optional[DeployState]:
+        return None
+
+    async def read_lines(self, task_id: str,
+                         after_id: int) -> Tuple[List[LogLine], bool]:
+        return [], True
+
+    async def evict(self, deploy_id: str):
+        pass
+
+
+class SqliteDeployStore(DeployStore):
+    """Deploys kept in a SQLite database every worker can open.
+
+    Meant for several uvicorn workers on one machine. WAL mode relies on
+    shared memory between the processes, so the file must be on a local
+    disk: it can't be shared across machines or over a network file
+    system. Queries run on a thread so they don't stall the event loop.
+    """
+
+    def __init__(self, path: Path, max_lines: int, retention: float):
+        self.path = path
+        self.max_lines = max_lines
+        self.retention = retention
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    async def open(self):
+        await asyncio.to_thread(self._open)
+
+    def _open(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30,
+                                     check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._lock, self._conn:
+            self._conn.executescript(SCHEMA)
+        # Deploys of workers that went away without evicting them
+        self._evict_older_than(time.time() - self.retention)
+
+    async def close(self):
+        if self._conn is not None:
+            await asyncio.to_thread(self._conn.close)
+            self._conn = None
+
+    async def add_task(self, task_id: str, deploy_id: str):
+        await asyncio.to_thread(self._execute,
+                                "INSERT OR REPLACE INTO tasks VALUES (?, ?)",
+                                (task_id, deploy_id))
+
+    async def save(self, deploy_id: str, state: DeployState,
+                   lines: List[LogLine], closed: bool = False):
+        await asyncio.to_thread(self._save, deploy_id, state, lines, closed)
+
+    def _save(self, deploy_id: str, state: DeployState,
+              lines: List[LogLine], closed: bool):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO deploys VALUES (?, ?, ?, ?)",
+                (deploy_id, state.model_dump_json(), int(closed), time.time()))
+            if not lines:
+                return
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO log_lines VALUES (?, ?, ?, ?, ?)",
+                [(deploy_id, line.id, line.event_type, line.timestamp,
+                  line.message) for line in lines])
+            # Same bound as the in-memory log
+            self._conn.execute(
+                "DELETE FROM log_lines WHERE deploy_id = ? AND id <= ?",
+                (deploy_id, lines[-1].id - self.max_lines))
+
+    async def get_state(self, task_id: str) -> Optional[DeployState]:
+        rows = await asyncio.to_thread(
+            self._execute,
+            "SELECT d.state FROM tasks t JOIN deploys d USING (deploy_id) "
+            "WHERE t.task_id = ?", (task_id,))
+        if not rows:
+            return None
+        return DeployState.model_validate_json(rows[0][0])
+
+    async def read_lines(self, task_id: str,
+                         after_id: int) -> Tuple[List[LogLine], bool]:
+        return await asyncio.to_thread(self._read_lines, task_id, after_id)
+
+    def _read_lines(self, task_id: str,
+                    after_id: int) -> Tuple[List[LogLine], bool]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT d.deploy_id, d.closed FROM tasks t "
+                "JOIN deploys d USING (deploy_id) WHERE t.task_id = ?",
+                (task_id,)).fetchone()
+            if row is None:
+                # Evicted, nothing more will come
+                return [], True
+            deploy_id, closed = row
+            rows = self._conn.execute(
+                "SELECT id, event_type, timestamp, message FROM log_lines "
+                "WHERE deploy_id = ? AND id > ? ORDER BY id LIMIT ?",
+                (deploy_id, after_id, READ_BATCH_SIZE)).fetchall()
+        return [LogLine(*row) for row in rows], bool(closed)
+
+    async def evict(self, deploy_id: str):
+        await asyncio.to_thread(self._evict, deploy_id)
+
+    def _evict(self, deploy_id: str):
+        with self._lock, self._conn:
+            for table in ("log_lines", "tasks", "deploys"):
+                self._conn.execute(
+                    f"DELETE FROM {table} WHERE deploy_id = ?", (deploy_id,))
+
+    def _evict_older_than(self, updated_before: float):
+        rows = self._execute(
+            "SELECT deploy_id FROM deploys WHERE updated_at < ?",
+            (updated_before,))
+        for (deploy_id,) in rows:
+            logger.info("Evicting stale deploy %s from the store", deploy_id)
+            self._evict(deploy_id)
+
+    def _execute(self, query: str, params: tuple) -> list:
+        with self._lock, self._conn:
+            return self._conn.execute(query, params).fetchall()
+
+
+class RedisDeployStore(DeployStore):
+    """Deploys kept in Redis, or any server speaking its protocol.
+
+    Shared by every worker on every machine that can reach the server, so
+    the backend can run on several machines. Keys expire `retention` seconds
+    after a deploy's last write, which also clears deploys of workers that
+    went away without evicting them.
+    """
+
+    def __init__(self, url: str, max_lines: int, retention: float,
+                 prefix: str = "comfyrun"):
+        self.url = url
+        self.max_lines = max_lines
+        self.ttl = max(1, int(retention))
+        self.prefix = prefix
+        self._redis = None
+
+    async def open(self):
+        # Only needed when this store is picked
+        # pylint: disable-next=import-outside-toplevel
+        from redis.asyncio import Redis
+
+        self._redis = Redis.from_url(self.url, decode_responses=True)
+        await self._redis.ping()
+
+    async def close(self):
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    async def add_task(self, task_id: str, deploy_id: str):
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.set(self._task_key(task_id), deploy_id, ex=self.ttl)
+            pipe.sadd(self._tasks_key(deploy_id), task_id)
+            pipe.expire(self._tasks_key(deploy_id), self.ttl)
+            await pipe.execute()
+
+    async def save(self, deploy_id: str, state: DeployState,
+                   lines: List[LogLine], closed: bool = False):
+        deploy_key = self._deploy_key(deploy_id)
+        lines_key = self._lines_key(deploy_id)
+        # Every write pushes the expiry of all the deploy's keys back
+        task_ids = await self._redis.smembers(self._tasks_key(deploy_id))
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(deploy_key, mapping={"state": state.model_dump_json(),
+                                           "closed": int(closed)})
+            if lines:
+                # Scored by id, the id in the member keeps equal lines apart
+                pipe.zadd(lines_key, {
+                    json.dumps([line.id, line.event_type, line.timestamp,
+                                line.message]): line.id
+                    for line in lines})
+                # Same bound as the in-memory log
+                pipe.zremrangebyscore(lines_key, "-inf",
+                                      lines[-1].id - self.max_lines)
+            for key in (deploy_key, lines_key, self._tasks_key(deploy_id)):
+                pipe.expire(key, self.ttl)
+            for task_id in task_ids:
+                pipe.expire(self._task_key(task_id), self.ttl)
+            await pipe.execute()
+
+    async def get_state(self, task_id: str) -> Optional[DeployState]:
+        deploy_id = await self._redis.get(self._task_key(task_id))
+        if deploy_id is None:
+            return None
+        state = await self._redis.hget(self._deploy_key(deploy_id), "state")
+        if state is None:
+            return None
+        return DeployState.model_validate_json(state)
+
+    async def read_lines(self, task_id: str,
+                         after_id: int) -> Tuple[List[LogLine], bool]:
+        deploy_id = await self._redis.get(self._task_key(task_id))
+        if deploy_id is None:
+            # Evicted or expired, nothing more will come
+            return [], True
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.hget(self._deploy_key(deploy_id), "closed")
+            pipe.zrangebyscore(self._lines_key(deploy_id), f"({after_id}",
+                               "+inf", start=0, num=READ_BATCH_SIZE)
+            closed, members = await pipe.execute()
+        if closed is None:
+            return [], True
+        return ([LogLine(*json.loads(member)) for member in members],
+                closed == "1")
+
+    async def evict(self, deploy_id: str):
+        task_ids = await self._redis.smembers(self._tasks_key(deploy_id))
+        await self._redis.delete(
+            self._deploy_key(deploy_id), self._lines_key(deploy_id),
+            self._tasks_key(deploy_id),
+            *(self._task_key(task_id) for task_id in task_ids))
+
+    def _deploy_key(self, deploy_id: str) -> str:
+        return f"{self.prefix}:deploy:{deploy_id}"
+
+    def _lines_key(self, deploy_id: str) -> str:
+        return f"{self.prefix}:deploy:{deploy_id}:lines"
+
+    def _tasks_key(self, deploy_id: str) -> str:
+        return f"{self.prefix}:deploy:{deploy_id}:tasks"
+
+    def _task_key(self, task_id: str) -> str:
+        return f"{self.prefix}:task:{task_id}"
+
+
+def create_deploy_store(max_lines: int, retention: float) -> DeployStore:
+    # DEPLOY_STORE_URL (redis:// or rediss://) turns on the Redis store,
+    # shared across machines. DEPLOY_STORE_PATH turns on the SQLite store,
+    # shared by every worker on this machine pointed at the same file.
+    url = os.getenv("DEPLOY_STORE_URL")
+    if url:
+        return RedisDeployStore(url, max_lines, retention)
+    path = os.getenv("DEPLOY_STORE_PATH")
+    if path:
+        return SqliteDeployStore(Path(path), max_lines, retention)
+    return MemoryDeployStore()
@@ -0,0 +1,378 @@
+import asyncio
+import logging
+import os
+import time
+import uuid
+from collections import deque
+from typing import AsyncIterator, Callable, Dict, List, Optional
+
+from src.builds import (build_id, keep_build_in_use, prepare_build_dir,
+                        prune_builds, render_build_files)
+from src.deploy_store import STORE_POLL_INTERVAL, create_deploy_store
+from src.models import CreateAppPayload, DeployState, DeployStatus, LogLine
+from src.process_usage import ProcessUsage
+
+logger = logging.getLogger(__name__)
+
+# Max length of a single line read from a deploy subprocess
+STREAM_LINE_LIMIT = 1024 * 1024
+# Lines kept per deploy for replay. Older lines are dropped once it's full
+DEPLOY_LOG_MAX_LINES = int(os.getenv("DEPLOY_LOG_MAX_LINES", "5000"))
+# How long a finished deploy's logs stay available to /app-logs
+DEPLOY_LOG_RETENTION = float(os.getenv("DEPLOY_LOG_RETENTION_SECONDS", "3600"))
+# Deploys allowed to run `modal deploy` at the same time, the rest wait in
+# line. Every worker has its own scheduler, so the limit is per worker
+DEPLOY_MAX_CONCURRENCY = int(os.getenv("DEPLOY_MAX_CONCURRENCY", "2"))
+
+
+class DeployLog:
+    """Bounded, replayable log of a single deploy.
+
+    Lines get increasing ids starting at 1 so subscribers can resume after
+    the last id they saw. Any number of subscribers can follow the log; each
+    one is woken up when new lines arrive or the log is closed.
+    """
+
+    def __init__(self, max_lines: int = DEPLOY_LOG_MAX_LINES):
+        self._lines: deque = deque(maxlen=max_lines)
+        self._last_id = 0
+        self._changed = asyncio.Event()
+        self.closed = False
+
+    def append(self, event_type: str, timestamp: float, message: str) -> LogLine:
+        self._last_id += 1
+        line = LogLine(self._last_id, event_type, timestamp, message)
+        self._lines.append(line)
+        self._notify()
+        return line
+
+    def close(self):
+        self.closed = True
+        self._notify()
+
+    async def follow(self, after_id: int = 0) -> AsyncIterator[LogLine]:
+        while True:
+            lines = await self.wait_lines(after_id)
+            if not lines:
+                return
+            for line in lines:
+                yield line
+            after_id = lines[-1].id
+
+    async def wait_lines(self, after_id: int = 0,
+                         timeout: Optional[float] = None) -> List[LogLine]:
+        # Lines after `after_id`, waiting for some if there are none yet.
+        # Empty once the log is closed or `timeout` runs out.
+        # Grab the event before reading so a line appended in between
+        # can't be missed
+        changed = self._changed
+        lines = self._lines_after(after_id)
+        if lines or self.closed:
+            return lines
+        try:
+            await asyncio.wait_for(changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            return []
+        return self._lines_after(after_id)
+
+    def has_lines_after(self, after_id: int) -> bool:
+        return self._last_id > after_id
+
+    def _lines_after(self, after_id: int) -> List[LogLine]:
+        # Subscribers that fell behind the buffer resume at the oldest
+        # line still kept
+        return [line for line in self._lines if line.id > after_id]
+
+    def _notify(self):
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+
+class Deploy:
+    def __init__(self, task_id: str, build: str, downloads_models: bool = False):
+        self.task_id = task_id
+        self.build_id = build
+        self.downloads_models = downloads_models
+        # Every task id handed out for this deploy, including coalesced ones
+        self.task_ids = [task_id]
+        self.log = DeployLog()
+        self.task: Optional[asyncio.Task] = None
+        self.status = DeployStatus.QUEUED
+        self.exit_code: Optional[int] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.queue_position: Optional[int] = None
+        self.usage = ProcessUsage()
+
+    def state(self, task_id: Optional[str] = None) -> DeployState:
+        # `task_id` is the one the caller asked about, coalesced tasks share
+        # the deploy but keep their own id
+        duration = None
+        if self.started_at is not None:
+            duration = (self.finished_at or time.time()) - self.started_at
+        return DeployState(
+            task_id=task_id or self.task_id,
+            build_id=self.build_id,
+            status=self.status,
+            exit_code=self.exit_code,
+            created_at=self.created_at,
+            started_at=self.started_at,
+            finished_at=self.finished_at,
+            duration=duration,
+            queue_position=self.queue_position,
+            cpu_seconds=self.usage.cpu_seconds,
+            peak_memory_bytes=self.usage.peak_rss_bytes,
+        )
+
+
+class DeployScheduler:
+    """Runs at most `max_concurrency` deploys at once, in FIFO order.
+
+    Waiting deploys are told their position in the queue through their log
+    whenever it changes.
+    """
+
+    def __init__(self, max_concurrency: int = DEPLOY_MAX_CONCURRENCY):
+        self.max_concurrency = max(1, max_concurrency)
+        self._running = 0
+        self._waiting: deque = deque()
+
+    async def acquire(self, deploy: Deploy):
+        if self._running < self.max_concurrency and not self._waiting:
+            self._running += 1
+            return
+
+        slot = asyncio.get_running_loop().create_future()
+        self._waiting.append((deploy, slot))
+        self._report_positions()
+        try:
+            await slot
+        except asyncio.CancelledError:
+            if slot.done() and not slot.cancelled():
+                # Cancelled right after being handed a slot, pass it on
+                self.release()
+            else:
+                self._waiting.remove((deploy, slot))
+                self._report_positions()
+            raise
+        finally:
+            deploy.queue_position = None
+
+    def release(self):
+        # Hand the slot straight to the next deploy in line, if any
+        while self._waiting:
+            _, slot = self._waiting.popleft()
+            if not slot.done():
+                slot.set_result(None)
+                self._report_positions()
+                return
+        self._running -= 1
+
+    def _report_positions(self):
+        for position, (deploy, _) in enumerate(self._waiting, start=1):
+            if deploy.queue_position != position:
+                deploy.queue_position = position
+                deploy.log.append(
+                    "stdout", time.time(),
+                    f"Waiting for other deploys to finish, position in queue: {position}")
+
+
+deploys: Dict[str, Deploy] = {}
+# Deploy currently running or queued for each build id. Identical deploys
+# only coalesce when they reach the same worker
+active_builds: Dict[str, Deploy] = {}
+scheduler = DeployScheduler()
+# Where deploys started by this worker are mirrored for the other workers
+store = create_deploy_store(DEPLOY_LOG_MAX_LINES, DEPLOY_LOG_RETENTION)
+# Store writes still in flight, mirrors included, awaited on shutdown
+_store_tasks = set()
+# Called with every deploy once it has finished
+_deploy_listeners: List[Callable[[Deploy], None]] = []
+
+
+def add_deploy_listener(listener: Callable[[Deploy], None]):
+    _deploy_listeners.append(listener)
+
+
+async def start_deploy(payload: CreateAppPayload) -> str:
+    # The deploy starts right away and runs on its own, whether or not
+    # anyone watches its logs. Returns the task id to follow it with.
+    files = render_build_files(payload)
+    build = build_id(files)
+    task_id = str(uuid.uuid4())
+
+    # An identical deploy is already on its way, share it instead of running
+    # the same build twice. Both task ids follow the same log.
+    deploy = active_builds.get(build)
+    if deploy is not None:
+        logger.info("Coalescing task %s onto deploy %s of build %s",
+                    task_id, deploy.task_id, build)
+        deploy.task_ids.append(task_id)
+        deploys[task_id] = deploy
+        await store.add_task(task_id, deploy.task_id)
+        return task_id
+
+    deploy = Deploy(task_id, build, downloads_models=bool(payload.models))
+    deploys[task_id] = deploy
+    active_builds[build] = deploy
+    # Registered before returning, so the task id is known to every worker
+    # by the time the caller asks for its logs
+    await store.save(task_id, deploy.state(), [])
+    await store.add_task(task_id, task_id)
+    deploy.task = asyncio.create_task(_run_deploy(deploy, files))
+    if store.shared:
+        _start_store_task(_mirror_deploy(deploy))
+    return task_id
+
+
+async def get_deploy_state(task_id: str) -> Optional[DeployState]:
+    # Deploys run by this worker are served from memory, others from the store
+    deploy = deploys.get(task_id)
+    if deploy is not None:
+        return deploy.state(task_id)
+    state = await store.get_state(task_id)
+    if state is not None:
+        # Saved under the task that started the deploy
+        state.task_id = task_id
+    return state
+
+
+def follow_deploy_log(task_id: str, after_id: int = 0) -> AsyncIterator[LogLine]:
+    deploy = deploys.get(task_id)
+    if deploy is not None:
+        return deploy.log.follow(after_id)
+    return store.follow(task_id, after_id)
+
+
+async def cancel_deploys():
+    running = [deploy.task for deploy in active_builds.values()
+               if deploy.task is not None and not deploy.task.done()]
+    for task in running:
+        task.cancel()
+    await asyncio.gather(*running, return_exceptions=True)
+    # Let the store see how every deploy ended, including ones that finished
+    # just before shutdown, before it's closed
+    await asyncio.gather(*_store_tasks, return_exceptions=True)
+
+
+async def _run_deploy(deploy: Deploy, files: Dict[str, bytes]):
+    acquired = False
+    try:
+        await scheduler.acquire(deploy)
+        acquired = True
+        deploy.status = DeployStatus.RUNNING
+        deploy.started_at = time.time()
+        deploy.exit_code = await deploy_app(
+            deploy.build_id, files, deploy.log, deploy.usage)
+    except asyncio.CancelledError:
+        deploy.log.append("stderr", time.time(), "Deploy cancelled")
+        raise
+    except Exception as e:
+        logger.exception("Deploy %s failed", deploy.task_id)
+        deploy.log.append("stderr", time.time(), f"Deploy failed: {e}")
+    finally:
+        if acquired:
+            scheduler.release()
+        active_builds.pop(deploy.build_id, None)
+        deploy.finished_at = time.time()
+        deploy.status = (DeployStatus.SUCCEEDED if deploy.exit_code == 0
+                         else DeployStatus.FAILED)
+        state = deploy.state()
+        logger.info("Deploy %s %s with exit code %s in %.1fs "
+                    "(cpu %.1fs, peak memory %.0f MB)", deploy.task_id,
+                    state.status.value, state.exit_code, state.duration or 0,
+                    state.cpu_seconds, state.peak_memory_bytes / 1024 / 1024)
+        deploy.log.close()
+        for listener in _deploy_listeners:
+            listener(deploy)
+        asyncio.get_running_loop().call_later(
+            DEPLOY_LOG_RETENTION, _evict_deploy, deploy)
+
+
+async def _mirror_deploy(deploy: Deploy):
+    # Copies new log lines and the current state into the store until the
+    # deploy is over. Lines that pile up during a write go out together in
+    # the next one.
+    after_id = 0
+    while True:
+        lines = await deploy.log.wait_lines(after_id, STORE_POLL_INTERVAL)
+        closed = deploy.log.closed and not deploy.log.has_lines_after(
+            lines[-1].id if lines else after_id)
+        try:
+            await store.save(deploy.task_id, deploy.state(), lines, closed)
+        except Exception:
+            logger.exception("Unable to save deploy %s to the store",
+                             deploy.task_id)
+        if lines:
+            after_id = lines[-1].id
+        if closed:
+            return
+
+
+def _evict_deploy(deploy: Deploy):
+    for task_id in deploy.task_ids:
+        deploys.pop(task_id, None)
+    _start_store_task(store.evict(deploy.task_id))
+
+
+def _start_store_task(coro) -> asyncio.Task:
+    task = asyncio.create_task(coro)
+    _store_tasks.add(task)
+    task.add_done_callback(_store_tasks.discard)
+    return task
+
+
+async def deploy_app(build: str, files: Dict[str, bytes], log: DeployLog,
+                     usage: ProcessUsage) -> int:
+    folder_path = await prepare_build_dir(build, files)
+    await asyncio.to_thread(prune_builds, active_builds.keys() | {build})
+
+    # Other workers prune by age, keep the directory fresh while deploying
+    heartbeat = asyncio.create_task(keep_build_in_use(folder_path))
+    try:
+        # Deploy workflows
+        return await run_command("modal deploy workflows", str(folder_path), log, usage)
+    finally:
+        heartbeat.cancel()
+
+
+async def run_command(command: str, cwd: str, log: DeployLog,
+                      usage: Optional[ProcessUsage] = None) -> int:
+    process = await asyncio.create_subprocess_shell(
+        command,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=cwd,
+        env={**os.environ,
+             "MODAL_TOKEN_ID": os.getenv("MODAL_TOKEN_ID"),
+             "MODAL_TOKEN_SECRET": os.getenv("MODAL_TOKEN_SECRET"),
+             "COLUMNS": "10000",
+             },
+        # Wide COLUMNS makes for long lines, don't choke on them
+        limit=STREAM_LINE_LIMIT,
+    )
+
+    tracker = asyncio.create_task(usage.track(process.pid)) if usage else None
+
+    # Both pipes are read concurrently, so a chatty stderr can't fill its
+    # pipe buffer and stall the deploy while we wait on stdout, and lines
+    # land in the log in the order they arrive
+    async def read_stream(stream, event_type):
+        while True:
+            line = await stream.readline()
+            if not line:
+                break
+            log.append(event_type, time.time(),
+                       line.decode(errors="replace").strip())
+
+    try:
+        await asyncio.gather(read_stream(process.stdout, "stdout"),
+                             read_stream(process.stderr, "stderr"))
+        return await process.wait()
+    finally:
+        if tracker is not None:
+            tracker.cancel()
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
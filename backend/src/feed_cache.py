@@ -0,0 +1,105 @@
+import asyncio
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Feed:
+    name: str
+    url: str
+
+
+class FeedCache:
+    """Last good copy of each ComfyUI-Manager json feed kept on disk.
+
+    Every feed is stored as `<name>.json` (the response body as received)
+    next to `<name>.meta.json` holding its ETag and Last-Modified headers,
+    which are sent back on the next fetch so unchanged feeds cost a 304.
+    A feed is only written once it has been applied, so a body of the wrong
+    shape is never served from disk on the next start.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+
+    def read(self, feed: Feed) -> Optional[Any]:
+        try:
+            with open(self._data_path(feed), "rb") as f:
+                return json.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable cache for %s: %s", feed.name, e)
+            return None
+
+    async def fetch(self, client: httpx.AsyncClient, feed: Feed,
+                    timeout: httpx.Timeout,
+                    apply: Callable[[Any], Awaitable[None]],
+                    conditional: bool = True) -> bool:
+        # Hands the parsed feed to `apply` and caches it when it changed
+        # upstream. Returns False when the cached copy is still current.
+        # Raises httpx.HTTPError on failure, and whatever `apply` or parsing
+        # raises for a body it can't use, in which case nothing is cached.
+        headers = {}
+        if conditional:
+            meta = await asyncio.to_thread(self._read_meta, feed)
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        response = await client.get(feed.url, headers=headers, timeout=timeout)
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            logger.info("%s is up to date", feed.name)
+            return False
+        response.raise_for_status()
+
+        meta = {
+            "url": feed.url,
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+        }
+        # Parsing and writing a multi-MB feed is kept off the event loop
+        data = await asyncio.to_thread(json.loads, response.content)
+        await apply(data)
+        await asyncio.to_thread(self._store, feed, response.content, meta)
+        return True
+
+    def _store(self, feed: Feed, content: bytes, meta: Dict):
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Data first, then the validators that describe it
+            _write_atomic(self._data_path(feed), content)
+            _write_atomic(self._meta_path(feed), json.dumps(meta).encode())
+        except OSError as e:
+            logger.warning("Unable to cache %s: %s", feed.name, e)
+
+    def _read_meta(self, feed: Feed) -> Dict:
+        if not self._data_path(feed).exists():
+            return {}
+        try:
+            with open(self._meta_path(feed), "rb") as f:
+                return json.loads(f.read())
+        except (OSError, ValueError):
+            return {}
+
+    def _data_path(self, feed: Feed) -> Path:
+        return self.cache_dir / f"{feed.name}.json"
+
+    def _meta_path(self, feed: Feed) -> Path:
+        return self.cache_dir / f"{feed.name}.meta.json"
+
+
+def _write_atomic(path: Path, content: bytes):
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
@@ -0,0 +1,78 @@
+import importlib.util
+import logging
+import os
+from collections import Counter
+from typing import Dict
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+HTTP_LIMITS = httpx.Limits(
+    max_connections=int(os.getenv("HTTP_MAX_CONNECTIONS", "20")),
+    max_keepalive_connections=int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "10")),
+    keepalive_expiry=float(os.getenv("HTTP_KEEPALIVE_EXPIRY_SECONDS", "60")),
+)
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0, pool=10.0)
+
+# Requests sent and responses received by the shared client, by status class
+request_counts: Counter = Counter()
+
+
+def http2_available() -> bool:
+    # httpx only speaks HTTP/2 when the optional h2 package is installed
+    return importlib.util.find_spec("h2") is not None
+
+
+def create_http_client() -> httpx.AsyncClient:
+    http2 = http2_available()
+    logger.info("Creating shared http client (http2=%s, limits=%s)",
+                http2, HTTP_LIMITS)
+    return httpx.AsyncClient(
+        http2=http2,
+        limits=HTTP_LIMITS,
+        timeout=HTTP_TIMEOUT,
+        follow_redirects=True,
+        event_hooks={"request": [_count_request],
+                     "response": [_count_response]},
+    )
+
+
+def pool_stats(client: httpx.AsyncClient) -> Dict:
+    stats = {
+        "http2_enabled": http2_available(),
+        "max_connections": HTTP_LIMITS.max_connections,
+        "max_keepalive_connections": HTTP_LIMITS.max_keepalive_connections,
+        "requests": dict(request_counts),
+        "connections": {"total": 0, "idle": 0, "active": 0, "http2": 0},
+        "by_origin": {},
+    }
+
+    # httpx doesn't expose its connection pool publicly, so read httpcore's
+    # pool behind the default transport and skip the details if that changes
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    if pool is None:
+        return stats
+
+    connections = stats["connections"]
+    for connection in list(pool.connections):
+        connections["total"] += 1
+        if connection.is_idle():
+            connections["idle"] += 1
+        else:
+            connections["active"] += 1
+        if "HTTP/2" in connection.info():
+            connections["http2"] += 1
+
+        origin = str(getattr(connection, "_origin", "unknown"))
+        stats["by_origin"][origin] = stats["by_origin"].get(origin, 0) + 1
+
+    return stats
+
+
+async def _count_request(request: httpx.Request):
+    request_counts["sent"] += 1
+
+
+async def _count_response(response: httpx.Response):
+    request_counts[f"{response.status_code // 100}xx"] += 1
@@ -2,28 +2,37 @@ import asyncio
 import os
 import json
 import re
-import uuid
 
 import logging
 from contextlib import asynccontextmanager
 
-from typing import Dict, Annotated, Optional
+from pathlib import Path
+from typing import Callable, Dict, Annotated, List, Literal, Optional
 from urllib.parse import unquote
 
-from fastapi import FastAPI, File, Header, HTTPException, Depends, status, Request
+from fastapi import (FastAPI, File, Header, HTTPException, Depends, Query,
+                     Response, status, Request)
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.encoders import jsonable_encoder
 from fastapi.responses import StreamingResponse, JSONResponse
 import httpx
 from httpx import ReadTimeout
 
 
 from dotenv import load_dotenv
-from slugify import slugify
 
+from src.deploys import (Deploy, add_deploy_listener, cancel_deploys,
+                         follow_deploy_log, get_deploy_state, start_deploy,
+                         store as deploy_store)
+from src.feed_cache import Feed, FeedCache
+from src.http_client import create_http_client, pool_stats
+from src.modal_gateway import create_modal_gateway
 from src.models import CreateAppPayload, App
-from src.node_map import local_node_map
+from src.node_map import (MODEL_LIST_URL, NODE_MAP_URL, build_model_map,
+                          load_local_model_map, load_local_node_map)
+from src.node_resolver import NodeResolver, COMFYUI_URL
+from src.ttl_cache import TTLCache
+from src.volume_browser import VolumeBrowser, paginate
 
 
 # Configure logging
@@ -39,11 +48,30 @@ load_dotenv()
 required_env_vars = ["MODAL_TOKEN_ID",
                      "MODAL_TOKEN_SECRET", "X_API_KEY", "CORS_ALLOWED_ORIGINS"]
 
+NODE_MAP_FEED = Feed("extension-node-map", NODE_MAP_URL)
+MODEL_LIST_FEED = Feed("model-list", MODEL_LIST_URL)
+# Timeout for each ComfyUI-Manager json fetch so startup never hangs on GitHub
+FETCH_TIMEOUT = httpx.Timeout(
+    float(os.getenv("FETCH_TIMEOUT_SECONDS", "15")), connect=5.0)
+# How often the feeds are revalidated while running. 0 disables the refresh
+FEED_REFRESH_INTERVAL = float(os.getenv("FEED_REFRESH_INTERVAL_SECONDS", "21600"))
+# How long the Modal workspace name is reused before asking the CLI again
+MODAL_WORKSPACE_TTL = float(os.getenv("MODAL_WORKSPACE_TTL_SECONDS", "3600"))
+# How long the /apps response is served from cache, and for how long after
+# that a stale copy is returned while a fresh one loads
+MODAL_APPS_TTL = float(os.getenv("MODAL_APPS_TTL_SECONDS", "10"))
+MODAL_APPS_STALE = float(os.getenv("MODAL_APPS_STALE_SECONDS", "60"))
+# How long a models volume listing is cached, and served stale while reloading
+MODELS_LISTING_TTL = float(os.getenv("MODELS_LISTING_TTL_SECONDS", "300"))
+MODELS_LISTING_STALE = float(os.getenv("MODELS_LISTING_STALE_SECONDS", "3600"))
+# Page size of /models when no limit is asked for, and the largest one it
+# hands out, so big folders never come back in one response
+MODELS_PAGE_MAX = 1000
+MODELS_PAGE_SIZE = min(int(os.getenv("MODELS_PAGE_SIZE", "200")), MODELS_PAGE_MAX)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # pylint: disable-next=global-statement
-
     # Check if require missing env vars are present. If not, throw error
     missing_vars = [
         env_var for env_var in required_env_vars if not os.getenv(env_var)]
@@ -51,27 +79,40 @@ async def lifespan(app: FastAPI):
         error_msg = f"Missing required environment variables: {', '.join(missing_vars)}"
         raise RuntimeError(error_msg)
 
-    # Fetch node map json
-    global ext_node_map, ext_model_map
-    node_map = await fetch_node_map()
-    # Need to reorder and put some custom_nodes at the top otherwise comfyui cli picks up other random nodes during the lookup from workflow.json files
-    ext_node_map = reorder_dict(
-        node_map, ["https://github.com/cubiq/ComfyUI_IPAdapter_plus"])
-
-    model_list = await fetch_model_list()
-    ext_model_map = {model['filename']: model for model in model_list['models']}
-
-    # Set model credentials for running modal commands
-    command = f"modal token set --token-id {os.getenv('MODAL_TOKEN_ID')} --token-secret {os.getenv('MODAL_TOKEN_SECRET')}"
-    process = await asyncio.create_subprocess_shell(
-        command,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
-    )
-    await process.communicate()
+    # Load node map json, model list and set modal credentials concurrently
+    # so cold start only waits for the slowest of them. Feeds cached on disk
+    # are served right away and revalidated in the background.
+    # pylint: disable-next=global-statement
+    global http_client
+    await deploy_store.open()
+    async with create_http_client() as client:
+        http_client = client
+        await asyncio.gather(
+            load_feed(client, NODE_MAP_FEED, set_node_map,
+                      set_local_node_map),
+            load_feed(client, MODEL_LIST_FEED, set_model_list,
+                      set_local_model_map),
+            set_modal_token(),
+        )
+        # After the token is set, so Modal workers start with it
+        await modal_gateway.open()
+        # Resolve the workspace now so the first page view doesn't wait on it
+        start_background_task(warm_modal_workspace())
+        add_deploy_listener(on_deploy_finished)
+        if FEED_REFRESH_INTERVAL > 0:
+            start_background_task(refresh_feeds_periodically(client))
+
+        yield
+
+        for task in background_tasks:
+            task.cancel()
+        await asyncio.gather(*background_tasks, return_exceptions=True)
+        await cancel_deploys()
+    await deploy_store.close()
+    await modal_gateway.close()
+    http_client = None
+    await set_node_map({})
 
-    yield
-    ext_node_map.clear()
 
 app = FastAPI(lifespan=lifespan)
 
@@ -86,9 +127,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-ext_node_map: Dict = {}
+node_resolver: NodeResolver = NodeResolver({})
 ext_model_map: Dict = {}
-tasks = {}
+# Shared by every outbound http call, open for the lifetime of the app
+http_client: Optional[httpx.AsyncClient] = None
+feed_cache = FeedCache(Path(os.getenv("FEED_CACHE_DIR", "/app/cache")))
+background_tasks = set()
+modal_gateway = create_modal_gateway()
+models_volume = VolumeBrowser(modal_gateway, "comfyui-models",
+                              MODELS_LISTING_TTL, MODELS_LISTING_STALE)
 
 
 @app.exception_handler(RequestValidationError)
@@ -103,29 +150,33 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 
 @app.post("/app")
 async def create_app(payload: CreateAppPayload):
-    task_id = str(uuid.uuid4())
-    task = deploy_app(payload)
-    tasks[task_id] = task
+    task_id = await start_deploy(payload)
     return {"status": "started", "task_id": task_id}
 
 
-async def stream_logs(task_id: str):
-    task = tasks.get(task_id)
-    if task is None:
-        return
-    try:
-        async for log_line in task:
-            logger.info("Sending event: %s", log_line)
-            yield f"{log_line}"
-    finally:
-        del tasks[task_id]
+async def stream_logs(task_id: str, last_event_id: int):
+    async for log_line in follow_deploy_log(task_id, after_id=last_event_id):
+        logger.info("Sending event: %s", log_line.message)
+        yield log_line.to_sse()
 
 
 @app.get("/app-logs/{task_id}")
-async def app_logs(task_id: str):
-    if tasks.get(task_id) is None:
+async def app_logs(task_id: str,
+                   last_event_id: Annotated[Optional[int], Header()] = None):
+    # Logs are kept after the deploy finishes, so a page refresh or a second
+    # viewer replays them from the start, or from Last-Event-ID on reconnect
+    if await get_deploy_state(task_id) is None:
         return {"message": "Task is already finished! :)"}
-    return StreamingResponse(stream_logs(task_id), media_type="text/event-stream")
+    return StreamingResponse(stream_logs(task_id, last_event_id or 0),
+                             media_type="text/event-stream")
+
+
+@app.get("/app-status/{task_id}")
+async def app_status(task_id: str):
+    state = await get_deploy_state(task_id)
+    if state is None:
+        raise HTTPException(status_code=404, detail=f"Unknown task: {task_id}")
+    return state
 
 
 @app.post("/generate-custom-nodes")
@@ -145,18 +196,7 @@ def verify_api_key(api_key: Annotated[str, Header(alias="X_API_KEY")]):
 @app.get("/apps", dependencies=[Depends(verify_api_key)])
 async def list_apps():
     try:
-        workspace = await run_modal_command("modal profile current")
-        logger.info("Current workspace: %s", workspace)
-
-        app_list_json = await run_modal_command("modal app list --json")
-        data = json.loads(app_list_json)
-        response = []
-
-        for item in data:
-            item['url'] = f"https://{workspace}--{item['Description']}-comfyworkflow-ui.modal.run"
-            updated_app = App.model_validate(item)
-            response.append(updated_app.model_dump())
-        return response
+        return await modal_apps.get(os.getenv("MODAL_TOKEN_ID"))
 
     except json.JSONDecodeError as e:
         logger.error("Failed to parse JSON output: %s", str(e))
@@ -171,27 +211,21 @@ async def list_apps():
 
 @app.delete("/apps/{app_id}", dependencies=[Depends(verify_api_key)])
 async def delete_app(app_id: str):
-    process = await asyncio.create_subprocess_exec(
-        "modal", "app", "stop", app_id,
-        env={**os.environ,
-             "MODAL_TOKEN_ID": os.getenv("MODAL_TOKEN_ID"),
-             "MODAL_TOKEN_SECRET": os.getenv("MODAL_TOKEN_SECRET"),
-             "COLUMNS": "10000",
-             })
-
-    returncode = await process.wait()
-
-    if returncode != 0:
+    try:
+        await modal_gateway.stop_app(app_id)
+    except Exception as e:
+        logger.error("Unable to stop app %s: %s", app_id, str(e))
         raise HTTPException(
-            status_code=500, detail=f"Unable to delete app: {app_id}")
+            status_code=500, detail=f"Unable to delete app: {app_id}") from e
 
+    modal_apps.invalidate()
     return {"app_id": app_id, "deleted": True}
 
 
 @app.get("/apps/{app_name}/workflow-urls", dependencies=[Depends(verify_api_key)])
 async def get_workflow_urls(app_name: str):
     try:
-        workspace = await run_modal_command("modal profile current")
+        workspace = await get_modal_workspace()
         edit_url = f"https://{workspace}--{app_name}-editingworkflow-ui.modal.run"
         run_url = f"https://{workspace}--{app_name}-comfyworkflow-ui.modal.run"
 
@@ -208,78 +242,34 @@ async def get_workflow_urls(app_name: str):
             status_code=500, detail="Internal server error") from e
 
 
-@app.get("/models", dependencies=[Depends(verify_api_key)])
-async def file_browser(path: Optional[str] = None):
-    decoded_path = unquote(path) if path else ''
-    command = f"modal volume ls comfyui-models {decoded_path} --json"
-    files_json = await run_modal_command(command.strip())
-    return json.loads(files_json)
-
-
-async def deploy_app(payload: CreateAppPayload):
-    folder_path = f"/app/builds/{payload.machine_name}"
-    cp_process = await asyncio.create_subprocess_exec("cp", "-r", "/app/src/template", folder_path)
-    await cp_process.wait()
-
-    config = {
-        "machine_name": slugify(payload.machine_name),
-        "gpu": payload.gpu.value,
-        "additional_dependencies": payload.additional_dependencies,
-        "idle_timeout": payload.idle_timeout
-    }
-
-    os.makedirs(os.path.dirname(f"{folder_path}/config.py"), exist_ok=True)
-    os.makedirs(os.path.dirname(f"{folder_path}/models.json"), exist_ok=True)
-    os.makedirs(os.path.dirname(
-        f"{folder_path}/custom_nodes.json"), exist_ok=True)
-
-    with open(f"{folder_path}/config.py", "w", encoding='utf-8') as f:
-        f.write("config = " + json.dumps(config))
-
-    with open(f"{folder_path}/custom_nodes.json", "w", encoding='utf-8') as f:
-        json.dump(jsonable_encoder(payload.custom_nodes), f, indent=4)
-
-    with open(f"{folder_path}/models.json", "w", encoding='utf-8') as f:
-        json.dump(jsonable_encoder(payload.models), f, indent=4)
-
-    async def run_command_and_stream(command):
-        process = await asyncio.create_subprocess_shell(
-            command,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=folder_path,
-            env={**os.environ,
-                 "MODAL_TOKEN_ID": os.getenv("MODAL_TOKEN_ID"),
-                 "MODAL_TOKEN_SECRET": os.getenv("MODAL_TOKEN_SECRET"),
-                 "COLUMNS": "10000",
-                 }
-        )
-
-        async def read_stream(stream, event_type):
-            while True:
-                line = await stream.readline()
-                if line:
-                    yield f"event: {event_type}\ndata:{line.decode().strip()}\n\n"
-                else:
-                    break
-
-        async def combine_streams(*streams):
-            for stream in streams:
-                async for item in stream:
-                    yield item
-
-        stdout_stream = read_stream(process.stdout, "stdout")
-        stderr_stream = read_stream(process.stderr, "stderr")
-        combined_streams = combine_streams(stdout_stream, stderr_stream)
-
-        async for line in combined_streams:
-            yield line
+@app.get("/metrics/http-pool", dependencies=[Depends(verify_api_key)])
+async def http_pool_metrics():
+    if http_client is None:
+        raise HTTPException(
+            status_code=503, detail="Http client is not initialized")
+    return pool_stats(http_client)
 
-        await process.wait()
 
-    # Deploy workflows
-    async for line in run_command_and_stream("modal deploy workflows"):
-        yield line
+@app.get("/models", dependencies=[Depends(verify_api_key)])
+async def file_browser(response: Response,
+                       path: Optional[str] = None,
+                       limit: Annotated[int, Query(ge=1, le=MODELS_PAGE_MAX)] = MODELS_PAGE_SIZE,
+                       cursor: Optional[str] = None,
+                       sort: Optional[Literal["name", "modified", "size"]] = None,
+                       order: Literal["asc", "desc"] = "asc"):
+    # The cursor of the next page, if any, comes back in X-Next-Cursor
+    decoded_path = unquote(path) if path else ''
+    entries = await models_volume.list(decoded_path)
+    try:
+        page, next_cursor = paginate(entries, limit, cursor, sort,
+                                     descending=order == "desc")
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400, detail=f"Invalid cursor: {cursor}") from e
+    response.headers["X-Total-Count"] = str(len(entries))
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return page
 
 
 async def extract_nodes_from_workflow(workflow):
@@ -305,56 +295,18 @@ async def extract_nodes_from_workflow(workflow):
                 for x in workflow['extra']['groupNodes'].values():
                     extract_nodes(x)
 
-    # lookup dependent custom nodes
-    ext_map = ext_node_map
-
-    rext_map = {}
-    preemption_map = {}
-    patterns = []
-    for k, v in ext_map.items():
-        if k == 'https://github.com/comfyanonymous/ComfyUI':
-            for x in v[0]:
-                if x not in preemption_map:
-                    preemption_map[x] = []
-
-                preemption_map[x] = k
-            continue
-
-        for x in v[0]:
-            if x not in rext_map:
-                rext_map[x] = []
-
-            rext_map[x].append(k)
-
-        if 'preemptions' in v[1]:
-            for x in v[1]['preemptions']:
-                if x not in preemption_map:
-                    preemption_map[x] = []
-
-                preemption_map[x] = k
-
-        if 'nodename_pattern' in v[1]:
-            patterns.append((v[1]['nodename_pattern'], k))
+    # lookup dependent custom nodes. Keep a local reference so a refresh
+    # swapping the resolver mid-request can't mix two versions of the map
+    resolver = node_resolver
 
     # identify used extensions
     used_exts = set()
     unknown_nodes = set()
 
     for node_name in used_nodes:
-        ext = preemption_map.get(node_name)
-
-        if ext is None:
-            ext = rext_map.get(node_name)
-            if ext is not None:
-                ext = ext[0]
-
-        if ext is None:
-            for pat_ext in patterns:
-                if re.search(pat_ext[0], node_name):
-                    ext = pat_ext[1]
-                    break
+        ext = resolver.resolve(node_name)
 
-        if ext == 'https://github.com/comfyanonymous/ComfyUI':
+        if ext == COMFYUI_URL:
             pass
         elif ext is not None:
             if 'Fooocus' in ext:
@@ -367,26 +319,161 @@ async def extract_nodes_from_workflow(workflow):
     return used_exts, unknown_nodes
 
 
-async def fetch_node_map():
-    async with httpx.AsyncClient() as client:
+async def load_feed(client: httpx.AsyncClient, feed: Feed,
+                    apply: Callable, fallback: Callable):
+    cached = await asyncio.to_thread(feed_cache.read, feed)
+    if cached is not None:
         try:
-            response = await client.get("https://raw.githubusercontent.com/ltdrdata/ComfyUI-Manager/main/extension-node-map.json")
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError:
-            logger.error("Unable to fetch node map json from ComfyUIManager")
-            return local_node_map
+            await apply(cached)
+            start_background_task(revalidate_feed(client, feed, apply))
+            return
+        except Exception as e:
+            # Left by an older version that cached feeds before applying them
+            logger.warning("Ignoring cached %s: %s", feed.name, e)
 
+    try:
+        await feed_cache.fetch(client, feed, FETCH_TIMEOUT, apply,
+                               conditional=False)
+    except httpx.HTTPError:
+        logger.error("Unable to fetch %s json from ComfyUIManager", feed.name)
+        await fallback()
+    except Exception as e:
+        logger.error("Unusable %s json from ComfyUIManager: %s", feed.name, e)
+        await fallback()
+
+
+async def revalidate_feed(client: httpx.AsyncClient, feed: Feed, apply: Callable):
+    try:
+        if await feed_cache.fetch(client, feed, FETCH_TIMEOUT, apply):
+            logger.info("%s changed upstream, reloaded", feed.name)
+    except httpx.HTTPError as e:
+        logger.warning("Unable to revalidate %s, keeping current copy: %s",
+                       feed.name, e)
+    except Exception:
+        # Malformed json or a feed of the wrong shape, the current copy stays
+        logger.exception("Unusable %s from upstream, keeping current copy",
+                         feed.name)
+
+
+async def refresh_feeds_periodically(client: httpx.AsyncClient):
+    while True:
+        await asyncio.sleep(FEED_REFRESH_INTERVAL)
+        # A failed round is logged and retried next interval, the loop must
+        # outlive it
+        results = await asyncio.gather(
+            revalidate_feed(client, NODE_MAP_FEED, set_node_map),
+            revalidate_feed(client, MODEL_LIST_FEED, set_model_list),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Feed refresh failed: %s", result)
 
-async def fetch_model_list():
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get("https://raw.githubusercontent.com/ltdrdata/ComfyUI-Manager/main/model-list.json")
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError:
-            logger.error("Unable to fetch model list json from ComfyUIManager")
-            return local_node_map
+
+def on_deploy_finished(deploy: Deploy):
+    # A finished deploy creates or updates an app
+    modal_apps.invalidate()
+    # and downloads its models into the volume while building
+    if deploy.downloads_models:
+        models_volume.invalidate()
+
+
+def start_background_task(coro):
+    # Keep a reference so the task isn't garbage collected while running
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    return task
+
+
+async def load_modal_workspace() -> str:
+    workspace = await modal_gateway.workspace()
+    logger.info("Current workspace: %s", workspace)
+    return workspace
+
+
+modal_workspace = TTLCache(load_modal_workspace, MODAL_WORKSPACE_TTL)
+
+
+async def get_modal_workspace() -> str:
+    # Keyed by the token so a different token never gets a stale workspace
+    return await modal_workspace.get(os.getenv("MODAL_TOKEN_ID"))
+
+
+async def load_modal_apps() -> List[Dict]:
+    workspace = await get_modal_workspace()
+
+    data = await modal_gateway.list_apps()
+    response = []
+
+    for item in data:
+        item['url'] = f"https://{workspace}--{item['Description']}-comfyworkflow-ui.modal.run"
+        updated_app = App.model_validate(item)
+        response.append(updated_app.model_dump())
+    return response
+
+
+# The dashboard polls /apps, a short ttl keeps it fresh without running the
+# CLI for every view. Deploys and deletes drop the cached list right away.
+modal_apps = TTLCache(load_modal_apps, MODAL_APPS_TTL, MODAL_APPS_STALE)
+
+
+async def warm_modal_workspace():
+    try:
+        await get_modal_workspace()
+    except Exception as e:
+        logger.warning("Unable to resolve Modal workspace on startup: %s", e)
+
+
+async def set_modal_token():
+    # Set model credentials for running modal commands
+    command = f"modal token set --token-id {os.getenv('MODAL_TOKEN_ID')} --token-secret {os.getenv('MODAL_TOKEN_SECRET')}"
+    process = await asyncio.create_subprocess_shell(
+        command,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    await process.communicate()
+    # The workspace belongs to the token that was just set
+    modal_workspace.invalidate()
+
+
+def build_node_resolver(node_map) -> NodeResolver:
+    # Need to reorder and put some custom_nodes at the top otherwise comfyui cli picks up other random nodes during the lookup from workflow.json files
+    ext_node_map = reorder_dict(
+        node_map, ["https://github.com/cubiq/ComfyUI_IPAdapter_plus"])
+    return NodeResolver(ext_node_map)
+
+
+async def set_node_map(node_map):
+    # pylint: disable-next=global-statement
+    global node_resolver
+    # Build the full index off the event loop, then publish it with a single
+    # assignment so in-flight requests never see a half-built map
+    resolver = await asyncio.to_thread(build_node_resolver, node_map)
+    node_resolver = resolver
+    logger.info("Node resolver built with %d node types", len(resolver))
+
+
+async def set_model_list(model_list):
+    # pylint: disable-next=global-statement
+    global ext_model_map
+    ext_model_map = await asyncio.to_thread(build_model_map, model_list)
+
+
+async def set_local_node_map():
+    await set_node_map(await asyncio.to_thread(load_local_node_map))
+
+
+async def set_local_model_map():
+    # pylint: disable-next=global-statement
+    global ext_model_map
+    ext_model_map = await asyncio.to_thread(load_local_model_map)
+    if not ext_model_map:
+        logger.warning("Bundled model list is empty, no models will be matched. "
+                       "Refresh it with `python -m src.node_map`")
+        return
+    logger.info("Using bundled model list with %d models", len(ext_model_map))
 
 
 def reorder_dict(original_dict, keys_to_move_first):
@@ -408,35 +495,6 @@ def reorder_dict(original_dict, keys_to_move_first):
     return reordered
 
 
-async def run_modal_command(command: str) -> str:
-    try:
-        env = {
-            **os.environ,
-            "MODAL_TOKEN_ID": os.getenv("MODAL_TOKEN_ID"),
-            "MODAL_TOKEN_SECRET": os.getenv("MODAL_TOKEN_SECRET"),
-            "COLUMNS": "10000",
-        }
-        process = await asyncio.create_subprocess_shell(
-            command,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            env=env
-        )
-
-        stdout, stderr = await process.communicate()
-
-        if process.returncode != 0:
-            error_msg = stderr.decode().strip()
-            raise RuntimeError(
-                f"Command '{command}' failed with error: {error_msg}")
-
-        return stdout.decode().strip()
-    except Exception as e:
-        logger.exception(
-            "An error occurred while running command '%s': %s", command, str(e))
-        raise
-
-
 def extract_models(workflow, model_dict):
     pattern = re.compile(r'.*\.(safetensors|bin|sft)$')
     widget_values = set()
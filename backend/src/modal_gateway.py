@@ -0,0 +1,367 @@
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Helper processes kept running for Modal CLI commands
+MODAL_WORKER_POOL_SIZE = int(os.getenv("MODAL_WORKER_POOL_SIZE", "2"))
+# Longest a single Modal CLI command may take before its worker is killed
+MODAL_COMMAND_TIMEOUT = float(os.getenv("MODAL_COMMAND_TIMEOUT_SECONDS", "60"))
+# Idle workers are pinged before reuse when they haven't been used for this long
+WORKER_HEALTH_CHECK_INTERVAL = 30.0
+WORKER_HEALTH_CHECK_TIMEOUT = 5.0
+# Workers are replaced after this many commands to keep memory in check
+WORKER_MAX_COMMANDS = 500
+# Replies carry whole listings on a single line
+WORKER_LINE_LIMIT = 16 * 1024 * 1024
+
+
+class ModalGateway(ABC):
+    """Operations the backend runs against the Modal account.
+
+    Results have the same shape as the json printed by the matching Modal
+    CLI command, so callers don't care which implementation they talk to.
+    """
+
+    async def open(self):
+        pass
+
+    async def close(self):
+        pass
+
+    @abstractmethod
+    async def workspace(self) -> str:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_apps(self) -> List[Dict]:
+        # Same as `modal app list --json`
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_volume(self, volume: str, path: str) -> List[Dict]:
+        # Same as `modal volume ls <volume> <path> --json`
+        raise NotImplementedError
+
+    @abstractmethod
+    async def stop_app(self, app_id: str):
+        raise NotImplementedError
+
+
+class CliModalGateway(ModalGateway):
+    """Runs Modal CLI commands on a pool of pre-warmed worker processes."""
+
+    def __init__(self, pool: Optional["ModalWorkerPool"] = None):
+        self.pool = pool or ModalWorkerPool()
+
+    async def open(self):
+        await self.pool.start()
+
+    async def close(self):
+        await self.pool.close()
+
+    async def workspace(self) -> str:
+        return await self._run("profile", "current")
+
+    async def list_apps(self) -> List[Dict]:
+        return json.loads(await self._run("app", "list", "--json"))
+
+    async def list_volume(self, volume: str, path: str) -> List[Dict]:
+        args = ["volume", "ls", volume] + ([path] if path else []) + ["--json"]
+        return json.loads(await self._run(*args))
+
+    async def stop_app(self, app_id: str):
+        await self._run("app", "stop", app_id)
+
+    async def _run(self, *args: str) -> str:
+        command = " ".join(["modal", *args])
+        returncode, stdout, stderr = await self.pool.run(list(args))
+        if returncode != 0:
+            raise RuntimeError(
+                f"Command '{command}' failed with error: {stderr.strip()}")
+        return stdout.strip()
+
+
+class ModalWorker:
+    def __init__(self, process: asyncio.subprocess.Process):
+        self.process = process
+        self.last_used = time.monotonic()
+        self.commands = 0
+
+    @property
+    def alive(self) -> bool:
+        return self.process.returncode is None
+
+    async def request(self, args: List[str], timeout: float) -> Dict:
+        self.process.stdin.write((json.dumps({"args": args}) + "\n").encode())
+        await self.process.stdin.drain()
+        line = await asyncio.wait_for(self.process.stdout.readline(), timeout)
+        if not line:
+            raise RuntimeError("Modal worker exited")
+        self.last_used = time.monotonic()
+        return json.loads(line)
+
+    async def kill(self):
+        if self.alive:
+            self.process.kill()
+        await self.process.wait()
+
+
+class ModalWorkerPool:
+    """Bounded pool of long-lived `src.modal_worker` processes.
+
+    Each worker imports modal once and then runs CLI commands sent over its
+    stdin, so commands skip interpreter startup. At most `size` commands run
+    at once, the rest wait for a worker. A worker that dies, fails a health
+    check or exceeds the command timeout is killed and replaced.
+    """
+
+    def __init__(self, size: int = MODAL_WORKER_POOL_SIZE,
+                 timeout: float = MODAL_COMMAND_TIMEOUT):
+        self.size = max(1, size)
+        self.timeout = timeout
+        self._slots = asyncio.Semaphore(self.size)
+        self._idle: List[ModalWorker] = []
+
+    async def start(self):
+        # Pre-warm every worker so the first commands don't pay for startup
+        missing = self.size - len(self._idle)
+        workers = await asyncio.gather(
+            *(self._spawn() for _ in range(missing)), return_exceptions=True)
+        for worker in workers:
+            if isinstance(worker, ModalWorker):
+                self._idle.append(worker)
+            else:
+                logger.warning("Unable to start Modal worker: %s", worker)
+
+    async def close(self):
+        idle, self._idle = self._idle, []
+        await asyncio.gather(*(worker.kill() for worker in idle))
+
+    async def run(self, args: List[str]) -> Tuple[int, str, str]:
+        async with self._slots:
+            worker = await self._acquire()
+            try:
+                reply = await worker.request(args, self.timeout)
+            except BaseException:
+                # Its state is unknown after a timeout or a broken pipe
+                await worker.kill()
+                raise
+            self._release(worker)
+        return reply["returncode"], reply.get("stdout", ""), reply.get("stderr", "")
+
+    async def _acquire(self) -> ModalWorker:
+        while self._idle:
+            worker = self._idle.pop()
+            if await self._healthy(worker):
+                return worker
+            await worker.kill()
+        return await self._spawn()
+
+    def _release(self, worker: ModalWorker):
+        worker.commands += 1
+        if worker.alive and worker.commands < WORKER_MAX_COMMANDS:
+            self._idle.append(worker)
+        else:
+            asyncio.get_running_loop().create_task(worker.kill())
+
+    async def _healthy(self, worker: ModalWorker) -> bool:
+        if not worker.alive:
+            return False
+        if time.monotonic() - worker.last_used < WORKER_HEALTH_CHECK_INTERVAL:
+            return True
+        try:
+            await worker.request([], WORKER_HEALTH_CHECK_TIMEOUT)
+            return True
+        except (OSError, RuntimeError, ValueError, asyncio.TimeoutError) as e:
+            logger.warning("Modal worker %s failed health check: %s",
+                           worker.process.pid, e)
+            return False
+
+    async def _spawn(self) -> ModalWorker:
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "-m", "src.modal_worker",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            cwd=Path(__file__).parent.parent,
+            env={**os.environ,
+                 "MODAL_TOKEN_ID": os.getenv("MODAL_TOKEN_ID"),
+                 "MODAL_TOKEN_SECRET": os.getenv("MODAL_TOKEN_SECRET"),
+                 "COLUMNS": "10000",
+                 },
+            limit=WORKER_LINE_LIMIT,
+        )
+        logger.info("Started Modal worker %s", process.pid)
+        return ModalWorker(process)
+
+
+class SdkModalGateway(ModalGateway):
+    """Talks to Modal through the `modal` package over one long-lived client.
+
+    Uses the same calls as the CLI commands it replaces, some of which are
+    internal to the pinned modal version. If they can't be used (import or
+    API mismatch after an upgrade) every operation goes through `fallback`
+    from then on.
+    """
+
+    def __init__(self, fallback: ModalGateway):
+        self.fallback = fallback
+        self._client = None
+        self._client_lock = asyncio.Lock()
+        self._use_fallback = False
+
+    async def close(self):
+        if self._client is not None:
+            # pylint: disable-next=protected-access
+            await self._client._close()
+            self._client = None
+        await self.fallback.close()
+
+    async def workspace(self) -> str:
+        return await self._call("workspace", self._workspace)
+
+    async def list_apps(self) -> List[Dict]:
+        return await self._call("list_apps", self._list_apps)
+
+    async def list_volume(self, volume: str, path: str) -> List[Dict]:
+        return await self._call("list_volume", self._list_volume, volume, path)
+
+    async def stop_app(self, app_id: str):
+        await self._call("stop_app", self._stop_app, app_id)
+
+    async def _call(self, name: str, operation, *args):
+        if not self._use_fallback:
+            try:
+                return await operation(*args)
+            except (ImportError, AttributeError, TypeError) as e:
+                logger.warning("Modal SDK unusable (%s), switching to the CLI", e)
+                self._use_fallback = True
+        return await getattr(self.fallback, name)(*args)
+
+    async def _get_client(self):
+        # pylint: disable=import-outside-toplevel
+        from modal.client import _Client
+
+        async with self._client_lock:
+            if self._client is None:
+                self._client = await _Client.from_credentials(
+                    os.getenv("MODAL_TOKEN_ID"), os.getenv("MODAL_TOKEN_SECRET"))
+            return self._client
+
+    async def _workspace(self) -> str:
+        # pylint: disable=import-outside-toplevel
+        from google.protobuf.empty_pb2 import Empty
+
+        client = await self._get_client()
+        response = await client.stub.WorkspaceNameLookup(Empty())
+        # `modal profile current` prints the profile `modal token set` named
+        # after `username`, `workspace_name` is deprecated
+        return response.username
+
+    async def _list_apps(self) -> List[Dict]:
+        # pylint: disable=import-outside-toplevel
+        from modal.app_utils import _list_apps
+        from modal.cli.app import APP_STATE_TO_MESSAGE
+        from modal.cli.utils import timestamp_to_local
+        from modal_proto import api_pb2
+
+        client = await self._get_client()
+        now = time.time()
+        apps = []
+        for app_stats in await _list_apps(client=client):
+            # Same filtering as the CLI: no single-object apps, and only apps
+            # stopped within the last two hours
+            if (app_stats.object_entity and app_stats.object_entity != "ap") or (
+                app_stats.state in {api_pb2.AppState.APP_STATE_STOPPED,
+                                    api_pb2.AppState.APP_STATE_DERIVED}
+                and (now - app_stats.stopped_at) > 2 * 60 * 60
+            ):
+                continue
+            state = APP_STATE_TO_MESSAGE.get(app_stats.state)
+            apps.append({
+                "App ID": app_stats.app_id,
+                "Description": app_stats.description,
+                "State": state.plain if state is not None else "unknown",
+                "Tasks": str(app_stats.n_running_tasks),
+                "Created at": timestamp_to_local(app_stats.created_at, True),
+                "Stopped at": timestamp_to_local(app_stats.stopped_at, True),
+            })
+        return apps
+
+    async def _list_volume(self, volume: str, path: str) -> List[Dict]:
+        # pylint: disable=import-outside-toplevel
+        from modal.cli.utils import timestamp_to_local
+        from modal.cli.volume import humanize_filesize
+        from modal.volume import FileEntryType, _Volume
+
+        client = await self._get_client()
+        vol = await _Volume.lookup(volume, client=client)
+        file_types = {FileEntryType.DIRECTORY: "dir",
+                      FileEntryType.SYMLINK: "link"}
+        return [{
+            "Filename": entry.path,
+            "Type": file_types.get(entry.type, "file"),
+            "Created/Modified": timestamp_to_local(entry.mtime, False),
+            "Size": humanize_filesize(entry.size),
+        } for entry in await vol.listdir(path or "/")]
+
+    async def _stop_app(self, app_id: str):
+        # pylint: disable=import-outside-toplevel
+        from modal_proto import api_pb2
+
+        client = await self._get_client()
+        await client.stub.AppStop(api_pb2.AppStopRequest(
+            app_id=app_id, source=api_pb2.APP_STOP_SOURCE_CLI))
+
+
+class FakeModalGateway(ModalGateway):
+    """In-memory stand-in for tests and local development without Modal."""
+
+    def __init__(self, workspace: str = "fake-workspace",
+                 apps: Optional[List[Dict]] = None,
+                 volumes: Optional[Dict[str, Dict[str, List[Dict]]]] = None):
+        self._workspace = workspace
+        self.apps = apps if apps is not None else []
+        # Volume name -> path -> listing
+        self.volumes = volumes if volumes is not None else {}
+        self.calls: List[str] = []
+
+    async def workspace(self) -> str:
+        self.calls.append("workspace")
+        return self._workspace
+
+    async def list_apps(self) -> List[Dict]:
+        self.calls.append("list_apps")
+        return [dict(app) for app in self.apps]
+
+    async def list_volume(self, volume: str, path: str) -> List[Dict]:
+        self.calls.append("list_volume")
+        try:
+            return list(self.volumes[volume][path])
+        except KeyError as e:
+            raise RuntimeError(f"No such path in {volume}: {path}") from e
+
+    async def stop_app(self, app_id: str):
+        self.calls.append("stop_app")
+        for app in self.apps:
+            if app["App ID"] == app_id:
+                app["State"] = "stopped"
+                return
+        raise RuntimeError(f"No such app: {app_id}")
+
+
+def create_modal_gateway() -> ModalGateway:
+    # MODAL_GATEWAY picks the implementation: sdk (default), cli or fake
+    kind = os.getenv("MODAL_GATEWAY", "sdk")
+    if kind == "cli":
+        return CliModalGateway()
+    if kind == "fake":
+        return FakeModalGateway()
+    return SdkModalGateway(fallback=CliModalGateway())
@@ -0,0 +1,45 @@
+"""Long-lived helper process running Modal CLI commands.
+
+Started by `ModalWorkerPool` as `python -m src.modal_worker`. Every line on
+stdin is a json request `{"args": [...]}` holding the arguments of a `modal`
+command. Every line on stdout is the json reply with its return code and
+captured output. Empty args are a health check.
+"""
+import io
+import json
+import sys
+from contextlib import redirect_stderr, redirect_stdout
+from typing import Dict, List
+
+
+def run(cli, args: List[str]) -> Dict:
+    stdout, stderr = io.StringIO(), io.StringIO()
+    returncode = 0
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            cli.main(args, prog_name="modal", standalone_mode=False)
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else 1
+        # pylint: disable-next=broad-exception-caught
+        except Exception as e:
+            print(f"{type(e).__name__}: {e}", file=sys.stderr)
+            returncode = 1
+    return {"returncode": returncode,
+            "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+
+def main():
+    # Paid once per worker instead of once per command
+    # pylint: disable-next=import-outside-toplevel
+    from modal.cli.entry_point import entrypoint_cli
+
+    protocol = sys.stdout
+    for line in sys.stdin:
+        args = json.loads(line)["args"]
+        reply = run(entrypoint_cli, args) if args else {"returncode": 0}
+        protocol.write(json.dumps(reply) + "\n")
+        protocol.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
 
+import json
+from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, List, Literal, Optional
 from pydantic import BaseModel, HttpUrl, Field
@@ -20,6 +22,8 @@ class Model(BaseModel):
     url: HttpUrl
     path: str
     filename: Optional[str] = None
+    # Checked against the downloaded file when given
+    sha256: Optional[str] = None
 
 
 class Gpu(str, Enum):
@@ -32,6 +36,13 @@ class Gpu(str, Enum):
     H100 = "h100"
 
 
+class DeployStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
 class CreateAppPayload(BaseModel):
     machine_name: str
     gpu: Gpu
@@ -41,6 +52,33 @@ class CreateAppPayload(BaseModel):
     idle_timeout: int
 
 
+class DeployState(BaseModel):
+    task_id: str
+    build_id: str
+    status: DeployStatus
+    exit_code: Optional[int] = None
+    created_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    duration: Optional[float] = None
+    queue_position: Optional[int] = None
+    cpu_seconds: float = 0.0
+    peak_memory_bytes: int = 0
+
+
+@dataclass(frozen=True)
+class LogLine:
+    id: int
+    event_type: str
+    timestamp: float
+    message: str
+
+    def to_sse(self) -> str:
+        data = json.dumps({"timestamp": int(self.timestamp * 1000),
+                           "message": self.message})
+        return f"id: {self.id}\nevent: {self.event_type}\ndata:{data}\n\n"
+
+
 class App(BaseModel):
     app_id: str = Field(alias="App ID")
     description: str = Field(alias="Description")
@@ -0,0 +1,79 @@
+import logging
+import re
+from typing import Dict, List, Optional, Pattern, Tuple
+
+logger = logging.getLogger(__name__)
+
+COMFYUI_URL = "https://github.com/comfyanonymous/ComfyUI"
+
+
+class NodeResolver:
+    """Read-only index from a node type to the extension that provides it.
+
+    Built once from the ComfyUI-Manager extension node map so that resolving
+    a workflow only does dictionary lookups. Instances are never mutated; a
+    refreshed node map gets a new resolver which is swapped in whole.
+    """
+
+    __slots__ = ("_preemption_map", "_rext_map", "_patterns")
+
+    def __init__(self, ext_map: Dict):
+        preemption_map: Dict[str, str] = {}
+        rext_map: Dict[str, str] = {}
+        patterns: List[Tuple[str, str]] = []
+
+        for k, v in ext_map.items():
+            if k == COMFYUI_URL:
+                for x in v[0]:
+                    preemption_map[x] = k
+                continue
+
+            for x in v[0]:
+                # First extension listing a node wins, which is why some
+                # extensions get reordered to the top of the map
+                rext_map.setdefault(x, k)
+
+            for x in v[1].get('preemptions', []):
+                preemption_map[x] = k
+
+            if 'nodename_pattern' in v[1]:
+                patterns.append((v[1]['nodename_pattern'], k))
+
+        self._preemption_map = preemption_map
+        self._rext_map = rext_map
+        self._patterns = _compile_patterns(patterns)
+
+    def __len__(self):
+        return len(self._rext_map)
+
+    def resolve(self, node_name: str) -> Optional[str]:
+        ext = self._preemption_map.get(node_name)
+
+        if ext is None:
+            ext = self._rext_map.get(node_name)
+
+        if ext is None:
+            ext = self._match_pattern(node_name)
+
+        return ext
+
+    def _match_pattern(self, node_name: str) -> Optional[str]:
+        # First pattern in map order that matches anywhere in the name wins
+        for pattern, pattern_ext in self._patterns:
+            if pattern.search(node_name):
+                return pattern_ext
+        return None
+
+
+def _compile_patterns(
+        patterns: List[Tuple[str, str]]) -> Tuple[Tuple[Pattern, str], ...]:
+    # Compiled once per node map instead of on every lookup. Invalid
+    # patterns are skipped so one bad entry can't break every request.
+    compiled: List[Tuple[Pattern, str]] = []
+    for pattern, ext in patterns:
+        try:
+            compiled.append((re.compile(pattern), ext))
+        except re.error as e:
+            logger.warning("Skipping invalid nodename_pattern %r for %s: %s",
+                           pattern, ext, e)
+    return tuple(compiled)
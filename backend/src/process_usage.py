@@ -0,0 +1,81 @@
+import asyncio
+import os
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+SAMPLE_INTERVAL = 1.0
+
+
+@dataclass
+class ProcessUsage:
+    """CPU time and peak memory of a subprocess and all of its descendants.
+
+    Sampled from /proc while the process runs, so it's only available on
+    Linux and short-lived children between two samples are partially missed
+    (their CPU time still shows up in their parent once they're reaped).
+    """
+    cpu_seconds: float = 0.0
+    peak_rss_bytes: int = 0
+
+    async def track(self, pid: int, interval: float = SAMPLE_INTERVAL):
+        while True:
+            sample = await asyncio.to_thread(sample_process_tree, pid)
+            if sample is None:
+                return
+            cpu_seconds, rss_bytes = sample
+            self.cpu_seconds = max(self.cpu_seconds, cpu_seconds)
+            self.peak_rss_bytes = max(self.peak_rss_bytes, rss_bytes)
+            await asyncio.sleep(interval)
+
+
+def sample_process_tree(pid: int) -> Optional[Tuple[float, int]]:
+    # Returns (cpu_seconds, rss_bytes) summed over the tree, or None once
+    # the root process is gone
+    root = _read_stat(pid)
+    if root is None:
+        return None
+
+    # Children already reaped are included in their parent's cutime/cstime
+    ticks = root[0] + root[1]
+    rss_pages = root[2]
+    for child in _descendants(pid):
+        stat = _read_stat(child)
+        if stat is not None:
+            ticks += stat[0] + stat[1]
+            rss_pages += stat[2]
+    return ticks / CLOCK_TICKS, rss_pages * PAGE_SIZE
+
+
+def _read_stat(pid: int) -> Optional[Tuple[int, int, int]]:
+    try:
+        with open(f"/proc/{pid}/stat", "r", encoding="utf-8") as f:
+            stat = f.read()
+    except OSError:
+        return None
+    # The command name can contain spaces, fields start after its ')'
+    fields = stat[stat.rindex(")") + 2:].split()
+    utime, stime, cutime, cstime = (int(x) for x in fields[11:15])
+    rss_pages = int(fields[21])
+    return utime + stime, cutime + cstime, rss_pages
+
+
+def _descendants(pid: int) -> List[int]:
+    result = []
+    pending = [pid]
+    while pending:
+        parent = pending.pop()
+        try:
+            tasks = os.listdir(f"/proc/{parent}/task")
+        except OSError:
+            continue
+        for task in tasks:
+            try:
+                with open(f"/proc/{parent}/task/{task}/children", "r", encoding="utf-8") as f:
+                    children = [int(x) for x in f.read().split()]
+            except OSError:
+                continue
+            result.extend(children)
+            pending.extend(children)
+    return result
@@ -1,6 +1,7 @@
 import os
 from modal import Image
 from config import config
+from helpers import COMFYUI_MODELS_PATH, MODELS_PATH
 
 current_directory = os.path.dirname(os.path.realpath(__file__))
 
@@ -18,7 +19,9 @@ def create_comfyui_image(use_nvidia: bool = True):
             .apt_install("git")
             .pip_install(dependencies)
             .run_commands(install_command)
-            .run_commands("rm -rf /root/comfy/ComfyUI/models")
+            # Models are read straight from the volume mounted at MODELS_PATH
+            # instead of being copied into every container
+            .run_commands(f"rm -rf {COMFYUI_MODELS_PATH} && ln -s {MODELS_PATH} {COMFYUI_MODELS_PATH}")
             .copy_local_dir(f"{current_directory}/comfyrun", "/root/comfy/ComfyUI/custom_nodes/comfyrun")
             .copy_local_file(f"{current_directory}/custom_nodes.json", "/root/")
             .run_commands("comfy --skip-prompt node install-deps --deps=/root/custom_nodes.json")
@@ -0,0 +1,250 @@
+from http.client import HTTPException
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.error import HTTPError
+from urllib.parse import urlencode
+from urllib.request import Request, urlopen
+import hashlib
+import os
+import re
+import threading
+import time
+
+# Bytes read from the network per write to disk
+READ_SIZE = 1024 * 1024
+# Files at least this big are fetched over several connections when the
+# server supports ranges
+PARALLEL_THRESHOLD = 1024 * 1024 * 1024
+PARALLEL_CONNECTIONS = 4
+# Unit of work for parallel downloads, and of resume after an interruption
+CHUNK_SIZE = 64 * 1024 * 1024
+# Bytes read per update while hashing a file already on disk
+HASH_READ_SIZE = 8 * 1024 * 1024
+RETRIES = 3
+TIMEOUT = 60
+USER_AGENT = "ComfyRun"
+
+CONTENT_RANGE_PATTERN = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
+
+
+class DownloadCancelled(Exception):
+    pass
+
+
+def download_file(url: str, dest: Path, connections: int = PARALLEL_CONNECTIONS,
+                  progress: Optional[Callable[[int, Optional[int]], None]] = None,
+                  stop: Optional[threading.Event] = None) -> str:
+    """Stream `url` into `dest`, resuming whatever an earlier attempt left.
+
+    Data goes to `<dest>.part` and is renamed to `dest` once complete, so
+    `dest` only ever exists in full. Big files on servers that support
+    ranges are fetched in chunks over `connections` connections, with the
+    finished chunks recorded in `<dest>.part.chunks` so a retry only fetches
+    the missing ones. `progress` is called with the bytes downloaded so far
+    and the total size, when known.
+
+    Returns the SHA256 of the file. Streamed downloads are hashed as the
+    data arrives, chunked ones once complete since chunks land out of order.
+    """
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    part = dest.with_name(dest.name + ".part")
+    chunks_file = dest.with_name(dest.name + ".part.chunks")
+    state = _Progress(progress)
+    digest = None
+
+    for attempt in range(RETRIES + 1):
+        try:
+            size, final_url, ranges = probe(url)
+            if (ranges and size is not None and connections > 1
+                    and (size >= PARALLEL_THRESHOLD or chunks_file.exists())):
+                _download_chunked(final_url, part, chunks_file, size,
+                                  connections, state, stop)
+                digest = None
+            else:
+                chunks_file.unlink(missing_ok=True)
+                digest = _download_stream(url, part, state, stop)
+            break
+        except (OSError, ValueError, HTTPException) as e:
+            if isinstance(e, HTTPError) and e.code < 500 and e.code != 429:
+                raise
+            if attempt == RETRIES:
+                raise
+            print(f"Download of {dest.name} interrupted ({e}), resuming", flush=True)
+            time.sleep(2 ** attempt)
+
+    os.replace(part, dest)
+    chunks_file.unlink(missing_ok=True)
+    return (digest or file_hash(dest)).hexdigest()
+
+
+class _Progress:
+    def __init__(self, callback):
+        self.callback = callback
+        self.done = 0
+        self.total: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def reset(self, done: int, total: Optional[int]):
+        with self._lock:
+            self.done = done
+            self.total = total
+        self._report()
+
+    def add(self, count: int):
+        with self._lock:
+            self.done += count
+        self._report()
+
+    def _report(self):
+        if self.callback is not None:
+            self.callback(self.done, self.total)
+
+
+def _open(url: str, start: int = 0, end: Optional[int] = None):
+    headers = {"User-Agent": USER_AGENT}
+    if start or end is not None:
+        headers["Range"] = f"bytes={start}-{'' if end is None else end}"
+    return urlopen(Request(url, headers=headers), timeout=TIMEOUT)
+
+
+def probe(url: str) -> Tuple[Optional[int], str, bool]:
+    # Total size, url after redirects and whether ranges are supported,
+    # found with a one byte range request
+    with _open(url, 0, 0) as response:
+        final_url = response.geturl()
+        if response.status == 206:
+            match = CONTENT_RANGE_PATTERN.match(response.headers.get("Content-Range", ""))
+            if match and match.group(3) != "*":
+                return int(match.group(3)), final_url, True
+            return None, final_url, False
+        length = response.headers.get("Content-Length")
+        return (int(length) if length else None), final_url, False
+
+
+def _download_stream(url: str, part: Path, state: _Progress,
+                     stop: Optional[threading.Event]):
+    # Returns the running hash of the part file
+    offset = part.stat().st_size if part.exists() else 0
+    try:
+        response = _open(url, offset)
+    except HTTPError as e:
+        if e.code != 416:
+            raise
+        # Nothing left after offset, the part file is already complete
+        return file_hash(part)
+
+    with response:
+        if response.status == 206:
+            match = CONTENT_RANGE_PATTERN.match(response.headers.get("Content-Range", ""))
+            total = int(match.group(3)) if match and match.group(3) != "*" else None
+            mode = "ab"
+            # Resumed, the hash picks up where the part file ends
+            digest = file_hash(part) if offset else hashlib.sha256()
+        else:
+            # Server ignored the range, start over
+            length = response.headers.get("Content-Length")
+            total = int(length) if length else None
+            offset = 0
+            mode = "wb"
+            digest = hashlib.sha256()
+        state.reset(offset, total)
+        with open(part, mode) as f:
+            while True:
+                if stop is not None and stop.is_set():
+                    raise DownloadCancelled()
+                data = response.read(READ_SIZE)
+                if not data:
+                    break
+                f.write(data)
+                digest.update(data)
+                state.add(len(data))
+
+    if total is not None and part.stat().st_size != total:
+        raise ValueError(f"expected {total} bytes, got {part.stat().st_size}")
+    return digest
+
+
+def _download_chunked(url: str, part: Path, chunks_file: Path, size: int,
+                      connections: int, state: _Progress,
+                      stop: Optional[threading.Event]):
+    chunks = [(start, min(start + CHUNK_SIZE, size) - 1)
+              for start in range(0, size, CHUNK_SIZE)]
+    done = _read_done_chunks(chunks_file) if part.exists() else set()
+    if not part.exists() or part.stat().st_size != size:
+        # Chunks land at their offset, so the file is sized up front
+        with open(part, "wb") as f:
+            f.truncate(size)
+        chunks_file.unlink(missing_ok=True)
+        done = set()
+
+    todo = [chunk for chunk in chunks if chunk[0] not in done]
+    state.reset(size - sum(end - start + 1 for start, end in todo), size)
+    lock = threading.Lock()
+    errors: List[BaseException] = []
+
+    def worker():
+        fd = os.open(part, os.O_WRONLY)
+        try:
+            while not errors:
+                with lock:
+                    if not todo:
+                        return
+                    start, end = todo.pop(0)
+                _fetch_chunk(url, fd, start, end, state, stop)
+                with lock, open(chunks_file, "a", encoding="utf-8") as f:
+                    f.write(f"{start}\n")
+        # pylint: disable-next=broad-exception-caught
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            os.close(fd)
+
+    threads = [threading.Thread(target=worker, daemon=True)
+               for _ in range(min(connections, len(todo)))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+
+
+def _fetch_chunk(url: str, fd: int, start: int, end: int, state: _Progress,
+                 stop: Optional[threading.Event]):
+    with _open(url, start, end) as response:
+        if response.status != 206:
+            raise ValueError(f"server ignored range {start}-{end}")
+        offset = start
+        while offset <= end:
+            if stop is not None and stop.is_set():
+                raise DownloadCancelled()
+            data = response.read(min(READ_SIZE, end - offset + 1))
+            if not data:
+                raise ValueError(f"chunk {start}-{end} ended early at {offset}")
+            os.pwrite(fd, data, offset)
+            offset += len(data)
+            state.add(len(data))
+
+
+def _read_done_chunks(chunks_file: Path) -> set:
+    try:
+        with open(chunks_file, encoding="utf-8") as f:
+            return {int(line) for line in f if line.strip()}
+    except (OSError, ValueError):
+        return set()
+
+
+def file_hash(path: Path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while True:
+            data = f.read(HASH_READ_SIZE)
+            if not data:
+                return digest
+            digest.update(data)
+
+
+def with_query(url: str, params: Dict[str, str]) -> str:
+    # Tokens go in the query string rather than an Authorization header,
+    # which would be forwarded to the storage a download redirects to
+    return f"{url}{'&' if '?' in url else '?'}{urlencode(params)}"
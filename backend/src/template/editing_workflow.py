@@ -1,5 +1,4 @@
 import subprocess
-import shutil
 from config import config
 from modal import (App, enter, Secret, web_server)
 from helpers import (models_volume, MODELS_PATH, unzip_insight_face_models)
@@ -30,10 +29,8 @@ app = App(
 )
 class EditingWorkflow:
     @enter()
-    def move_files(self):
-        print("Copying models")
-        shutil.move(MODELS_PATH, "/root/comfy/ComfyUI/models")
-        print("Models copied!!")
+    def prepare_models(self):
+        # ComfyUI's models folder links to the volume, nothing to copy
         unzip_insight_face_models()
 
     def _run_comfyui_server(self, port=8188):
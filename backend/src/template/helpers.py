@@ -1,14 +1,29 @@
 from pathlib import Path
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import urlparse
+import queue
+import re
 import subprocess
 import shutil
 import os
+import signal
 import sys
+import threading
+import time
+from typing import Optional, Tuple
 from modal import (Volume)
+from config import config
+from downloader import DownloadCancelled, download_file, with_query
+from model_cache import ModelManifest
 
 models_volume = Volume.from_name("comfyui-models", create_if_missing=True)
 
 MOUNT_PATH: Path = Path("/mnt")
 MODELS_PATH: Path = MOUNT_PATH / "models"
+# ComfyUI's models folder, a symlink to the volume so models are read in place
+COMFYUI_MODELS_PATH: Path = Path("/root/comfy/ComfyUI/models")
+# Size, hash and source of every model downloaded to the volume
+MANIFEST_PATH: Path = MODELS_PATH / ".manifest.json"
 
 
 ANTELOPEV2_MODEL_ZIP_PATH: Path = Path(
@@ -19,56 +34,269 @@ common_model_names = ["model.safetensors", "diffusion_pytorch_model.safetensors"
                       "diffusion_pytorch_model.fp16.safetensors", "model.bin", "diffusion_pytorch_model.fp16.bin"]
 CIVITAI_BASE_URL = "https://civitai.com"
 
+# Models downloaded at the same time, overall and per host ("*" for any
+# other host), set by the backend
+DOWNLOAD_CONCURRENCY = config["download_concurrency"]
+HOST_DOWNLOAD_CONCURRENCY = config["host_download_concurrency"]
+DEFAULT_HOST_DOWNLOAD_CONCURRENCY = HOST_DOWNLOAD_CONCURRENCY.get("*", 2)
+# Progress bar lines are logged at most this often per download
+PROGRESS_LOG_INTERVAL = 5.0
+PROGRESS_PATTERN = re.compile(r"\d+(\.\d+)?%")
+
+
+def model_paths(model):
+    # Where the model ends up, and the folder/filename comfy downloads it to
+    model_name = model["name"]
+    download_url = model["url"]
+    download_path = model["path"]
+    file_name = model.get("filename") or download_url.split("/")[-1]
+    if file_name in common_model_names:
+        checkpoint_path: Path = Path(
+            f"/mnt/models/{download_path}") / model_name
+        relative_path: Path = checkpoint_path
+    else:
+        checkpoint_path: Path = Path(
+            f"/mnt/models/{download_path}") / file_name
+        relative_path = Path(f"/mnt/models/{download_path}")
+    return checkpoint_path, relative_path, file_name
+
+
+def download_host(url: str) -> str:
+    host = urlparse(url).hostname or ""
+    return host[4:] if host.startswith("www.") else host
+
 
 def download_models(models, civitai_token) -> bool:
+    manifest = ModelManifest(MANIFEST_PATH, MODELS_PATH)
+    pending = []
     for model in models:
-        model_name = model["name"]
-        download_url = model["url"]
-        download_path = model["path"]
-        file_name = model.get("filename") or download_url.split("/")[-1]
+        checkpoint_path, relative_path, file_name = model_paths(model)
+        file_path = relative_path / file_name
         print(f"file_name: {file_name}")
-        if file_name in common_model_names:
-            checkpoint_path: Path = Path(
-                f"/mnt/models/{download_path}") / model_name
-            relative_path: Path = checkpoint_path
-        else:
-            checkpoint_path: Path = Path(
-                f"/mnt/models/{download_path}") / file_name
-            relative_path = Path(f"/mnt/models/{download_path}")
         print(f"checkpoint_path: {checkpoint_path}")
-        print(f"checkpoint_path exists : {checkpoint_path.exists()}")
-
         print(f"relative_path: {relative_path}")
+        fetch_url = None
+        if native_download_supported(model["url"]):
+            fetch_url = authorized_url(model["url"], civitai_token)
+        if manifest.is_complete(file_path, model["url"], model.get("sha256"), fetch_url):
+            print(f"skipping download of {model['name']}. File exists")
+        elif manifest.reuse(file_path, model["url"], model.get("sha256")):
+            print(f"skipping download of {model['name']}. Copied from another folder")
+        else:
+            if file_path.is_file():
+                print(f"Removing incomplete {file_path}", flush=True)
+                file_path.unlink()
+            pending.append(model)
+
+    if not pending:
+        return True
+
+    # Set on the first failure so the other downloads stop early
+    failed = threading.Event()
+    downloaded = []
+    failure = None
+    started_at = time.monotonic()
+    print(f"Downloading {len(pending)} models, {DOWNLOAD_CONCURRENCY} at a time", flush=True)
+
+    # Models only go to the pool once their host has a free slot, so no
+    # worker sits waiting on a busy host while other hosts' models queue up
+    waiting = list(pending)
+    running = {}
+    futures = {}
+
+    def submit_ready(executor):
+        for model in list(waiting):
+            if len(futures) >= DOWNLOAD_CONCURRENCY:
+                return
+            host = download_host(model["url"])
+            if running.get(host, 0) >= HOST_DOWNLOAD_CONCURRENCY.get(
+                    host, DEFAULT_HOST_DOWNLOAD_CONCURRENCY):
+                continue
+            waiting.remove(model)
+            running[host] = running.get(host, 0) + 1
+            futures[executor.submit(download_model, model, civitai_token,
+                                    manifest, failed)] = model
+
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_CONCURRENCY) as executor:
+        submit_ready(executor)
+        while futures and failure is None:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                model = futures.pop(future)
+                running[download_host(model["url"])] -= 1
+                try:
+                    return_code = future.result()
+                # pylint: disable-next=broad-exception-caught
+                except Exception as e:
+                    print(f"Model {model['name']} download failed: {e}",
+                          file=sys.stderr, flush=True)
+                    return_code = -1
+                if return_code != 0:
+                    if failure is None:
+                        failure = (model["name"], return_code)
+                        failed.set()
+                    continue
+                downloaded.append(model["name"])
+                print(f"[{len(downloaded)}/{len(pending)}] Model {model['name']} downloaded successfully "
+                      f"({time.monotonic() - started_at:.0f}s elapsed)", flush=True)
+            if failure is None:
+                submit_ready(executor)
+
+    print(f"Downloaded {len(downloaded)} of {len(pending)} models in "
+          f"{time.monotonic() - started_at:.0f}s", flush=True)
+    if failure is None:
+        return True
+    model_name, return_code = failure
+    print(f"Model {model_name} download failed with return code {return_code}", flush=True)
+    not_downloaded = [model["name"] for model in pending
+                      if model["name"] not in downloaded and model["name"] != model_name]
+    if not_downloaded:
+        print(f"Stopped before finishing: {', '.join(not_downloaded)}", flush=True)
+    return False
+
+
+def download_model(model, civitai_token, manifest: ModelManifest,
+                   failed: threading.Event) -> int:
+    model_name = model["name"]
+    download_url = model["url"]
+    _, relative_path, file_name = model_paths(model)
+    if failed.is_set():
+        return -1
+    print(f"Downloading {model_name} ....", flush=True)
+    sha256 = None
+    if native_download_supported(download_url):
+        return_code, sha256 = download_natively(model, civitai_token, failed)
+    else:
+        return_code = download_with_comfy(model, civitai_token, failed)
+    if return_code != 0:
+        return return_code
+    # Files the comfy cli downloaded are hashed here
+    if not manifest.record(relative_path / file_name, download_url,
+                           model.get("sha256"), sha256):
+        return 1
+    return 0
+
+
+def download_natively(model, civitai_token,
+                      failed: threading.Event) -> Tuple[int, Optional[str]]:
+    # Return code, and the SHA256 of the file once downloaded
+    model_name = model["name"]
+    _, relative_path, file_name = model_paths(model)
+    try:
+        sha256 = download_file(authorized_url(model["url"], civitai_token),
+                               relative_path / file_name,
+                               progress=ProgressLog(model_name), stop=failed)
+    except DownloadCancelled:
+        return -1, None
+    # pylint: disable-next=broad-exception-caught
+    except Exception as e:
+        print(f"[{model_name}] Error: {e}", file=sys.stderr, flush=True)
+        return 1, None
+    return 0, sha256
+
 
-        if not checkpoint_path.exists():
-            print(f"Downloading {model_name} ....")
-            cmd = f"comfy --skip-prompt model download --url {download_url} --relative-path {relative_path} --filename {file_name} --set-civitai-api-token {civitai_token}"
-
-            with subprocess.Popen(
-                cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-                bufsize=1, universal_newlines=True
-            ) as download_process:
-                while True:
-                    output = download_process.stdout.readline()
-                    error = download_process.stderr.readline()
-                    if output == '' and error == '' and download_process.poll() is not None:
-                        break
-                    if output:
-                        print(output.strip(), flush=True)
-                    if error:
-                        print(f"Error: {error.strip()}",
-                              file=sys.stderr, flush=True)
-
-            # Check the return code
-            return_code = download_process.returncode
-            if return_code != 0:
-                print(f"Model download failed with return code {return_code}")
-                return False
-            else:
-                print(f"Model {model_name} downloaded successfully.")
+def authorized_url(url: str, civitai_token) -> str:
+    if download_host(url) == "civitai.com" and civitai_token:
+        return with_query(url, {"token": civitai_token})
+    return url
+
+
+def native_download_supported(url: str) -> bool:
+    # Civitai model pages need an API lookup to find the file, which the comfy
+    # cli knows how to do. Everything else is a direct download link.
+    return not (download_host(url) == "civitai.com"
+                and not urlparse(url).path.startswith("/api/download/"))
+
+
+class ProgressLog:
+    """Download progress callback logging at most every PROGRESS_LOG_INTERVAL."""
+
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+        self.last_logged_at = 0.0
+
+    def __call__(self, done: int, total: Optional[int]):
+        now = time.monotonic()
+        if now - self.last_logged_at < PROGRESS_LOG_INTERVAL and done != total:
+            return
+        self.last_logged_at = now
+        if total:
+            print(f"[{self.prefix}] {done * 100 // total}% of "
+                  f"{total / 1024 ** 2:.0f} MiB", flush=True)
+        else:
+            print(f"[{self.prefix}] {done / 1024 ** 2:.0f} MiB", flush=True)
+
+
+def download_with_comfy(model, civitai_token, failed: threading.Event) -> int:
+    model_name = model["name"]
+    download_url = model["url"]
+    _, relative_path, file_name = model_paths(model)
+    cmd = f"comfy --skip-prompt model download --url {download_url} --relative-path {relative_path} --filename {file_name} --set-civitai-api-token {civitai_token}"
+
+    with subprocess.Popen(
+        cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        bufsize=1, universal_newlines=True,
+        # Own process group, so stopping it also stops what the shell runs
+        start_new_session=True
+    ) as download_process:
+        pump_output(download_process, model_name, failed)
+
+    return download_process.returncode
+
+
+def pump_output(process: subprocess.Popen, prefix: str, stop: threading.Event):
+    # Each pipe gets its own reader thread, so a silent stdout never holds up
+    # stderr (or the other way round) and the child never stalls on a full
+    # pipe. Lines from both land in one queue in the order they were read.
+    lines = queue.Queue()
+
+    def read(stream, is_error):
+        for line in iter(stream.readline, ''):
+            lines.put((is_error, line))
+        lines.put(None)
+
+    for stream, is_error in ((process.stdout, False), (process.stderr, True)):
+        threading.Thread(target=read, args=(stream, is_error), daemon=True).start()
+
+    open_streams = 2
+    last_progress_at = 0.0
+    held_progress = None
+    while open_streams:
+        if stop.is_set() and process.poll() is None:
+            # Another model failed, no point finishing this one
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+        try:
+            item = lines.get(timeout=0.5)
+        except queue.Empty:
+            continue
+        if item is None:
+            open_streams -= 1
+            continue
+
+        is_error, line = item
+        line = line.strip()
+        if not line:
+            continue
+        if PROGRESS_PATTERN.search(line):
+            # Progress bars redraw many times a second, keep the log readable
+            now = time.monotonic()
+            if now - last_progress_at < PROGRESS_LOG_INTERVAL:
+                held_progress = line
+                continue
+            last_progress_at = now
+            held_progress = None
+            print(f"[{prefix}] {line}", flush=True)
+        elif is_error:
+            print(f"[{prefix}] Error: {line}", file=sys.stderr, flush=True)
         else:
-            print(f"skipping download of {model_name}. File exists")
-    return True
+            print(f"[{prefix}] {line}", flush=True)
+
+    if held_progress is not None:
+        print(f"[{prefix}] {held_progress}", flush=True)
+    process.wait()
 
 
 def unzip_insight_face_models():
@@ -76,3 +304,5 @@ def unzip_insight_face_models():
         print("Unzipping antelopev2..")
         shutil.unpack_archive(ANTELOPEV2_MODEL_ZIP_PATH, ANTELOPEV2_DEST_PATH)
         os.remove(ANTELOPEV2_MODEL_ZIP_PATH)
+        # Unzipped on the volume, keep it that way for the next container
+        models_volume.commit()
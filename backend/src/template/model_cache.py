@@ -0,0 +1,142 @@
+from pathlib import Path
+from typing import Dict, Optional
+import json
+import os
+import shutil
+import threading
+import time
+
+from downloader import file_hash, probe
+
+
+class ModelManifest:
+    """Record of the model files on the comfyui-models volume.
+
+    Kept as json next to the models, with the size, source url and SHA256
+    of every file downloaded through it. A file only counts as present when
+    its size matches the record, so files cut short by an interrupted
+    download are fetched again. Recorded hashes are checked lazily, only
+    when the model comes with an expected hash, and files found on the
+    volume without a record are only hashed then.
+
+    Only this container's view of the volume is read and written. Builds
+    running in other containers commit their own copy, and the last commit
+    wins. Entries lost that way are treated like files downloaded before the
+    manifest existed, and are checked against the size the server reports.
+    """
+
+    def __init__(self, path: Path, root: Path):
+        self.path = path
+        self.root = root
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict] = self._read()
+
+    def is_complete(self, file_path: Path, url: str,
+                    sha256: Optional[str] = None,
+                    fetch_url: Optional[str] = None) -> bool:
+        # `fetch_url` is `url` with any credentials needed to reach it, when
+        # it's a direct link whose size can be asked for
+        if not file_path.is_file():
+            return False
+        size = file_path.stat().st_size
+        with self._lock:
+            entry = self._entries.get(self._key(file_path))
+
+        if entry is None:
+            # Downloaded before the manifest existed, check it against the
+            # size the server reports
+            expected_size = remote_size(fetch_url) if fetch_url else None
+            if expected_size is not None and expected_size != size:
+                print(f"{file_path} is {size} bytes, expected {expected_size}", flush=True)
+                return False
+            entry = {"url": url, "size": size, "sha256": None}
+        elif entry["size"] != size:
+            print(f"{file_path} is {size} bytes, manifest says {entry['size']}", flush=True)
+            return False
+
+        if sha256 and entry.get("sha256") is None:
+            entry = {**entry, "sha256": file_sha256(file_path)}
+        # Recorded either way, so the hash is never computed twice
+        self._put(file_path, entry)
+        if sha256 and entry["sha256"] != sha256.lower():
+            print(f"{file_path} doesn't match its SHA256", flush=True)
+            return False
+        return True
+
+    def reuse(self, file_path: Path, url: str,
+              sha256: Optional[str] = None) -> bool:
+        # A complete copy of the same url elsewhere on the volume (e.g. the
+        # model moved to another folder) is copied over instead of downloaded
+        with self._lock:
+            candidates = [key for key, entry in self._entries.items()
+                          if entry["url"] == url and key != self._key(file_path)]
+        for key in candidates:
+            source = self.root / key
+            if not self.is_complete(source, url, sha256):
+                continue
+            print(f"Reusing {source} for {file_path}", flush=True)
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.link(source, file_path)
+            except OSError:
+                shutil.copy2(source, file_path)
+            with self._lock:
+                actual = self._entries[key].get("sha256")
+            return self.record(file_path, url, sha256, actual)
+        return False
+
+    def record(self, file_path: Path, url: str, sha256: Optional[str] = None,
+               actual: Optional[str] = None) -> bool:
+        # Adds a freshly downloaded file with its hash, checking it when one
+        # is expected. `actual` is the hash if the downloader already has it.
+        actual = actual or file_sha256(file_path)
+        if sha256 and actual != sha256.lower():
+            print(f"{file_path} doesn't match its SHA256, removing it", flush=True)
+            file_path.unlink(missing_ok=True)
+            return False
+        self._put(file_path, {"url": url, "size": file_path.stat().st_size,
+                              "sha256": actual})
+        return True
+
+    def _put(self, file_path: Path, entry: Dict):
+        key = self._key(file_path)
+        with self._lock:
+            if self._entries.get(key) == entry:
+                return
+            # Merge with what other manifests in this container wrote since
+            # we read it. Other containers' writes only show up after a
+            # volume reload, which can't happen while downloads hold files
+            # open
+            self._entries = {**self._read(), key: entry}
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": 1, "updated_at": time.time(),
+                           "models": self._entries}, f, indent=2)
+            os.replace(tmp_path, self.path)
+
+    def _read(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)["models"]
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Ignoring unreadable model manifest: {e}", flush=True)
+            return {}
+
+    def _key(self, file_path: Path) -> str:
+        return str(file_path.relative_to(self.root))
+
+
+def remote_size(url: str) -> Optional[int]:
+    try:
+        size, _, _ = probe(url)
+        return size
+    except (OSError, ValueError) as e:
+        # The url may carry a token, keep it out of the logs
+        print(f"Unable to get size of {url.split('?')[0]}: {e}", flush=True)
+        return None
+
+
+def file_sha256(file_path: Path) -> str:
+    return file_hash(file_path).hexdigest()
@@ -1,5 +1,4 @@
 import subprocess
-import shutil
 import json
 import os
 from config import config
@@ -42,9 +41,6 @@ class ComfyWorkflow:
             downloaded = download_models(models, os.environ["CIVITAI_TOKEN"])
             models_volume.commit()
             if downloaded:
-                print("Copying models")
-                shutil.move(MODELS_PATH, "/root/comfy/ComfyUI/models")
-                print("Models copied!!")
                 unzip_insight_face_models()
 
     def _run_comfyui_server(self, port=8188):
@@ -0,0 +1,76 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Generic, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache(Generic[T]):
+    """Single value produced by `load`, reused for `ttl` seconds.
+
+    The value is tied to a key (e.g. the credentials it was loaded with) and
+    reloaded as soon as the key changes. Callers arriving while a load is in
+    flight wait for that load instead of starting their own, and a failed
+    load is not cached. For `stale` seconds past its ttl the old value is
+    still returned right away while a reload runs in the background.
+    """
+
+    def __init__(self, load: Callable[[], Awaitable[T]], ttl: float,
+                 stale: float = 0.0):
+        self._load = load
+        self.ttl = ttl
+        self.stale = stale
+        self._key: Optional[Hashable] = None
+        self._value: Optional[T] = None
+        self._loaded_at: Optional[float] = None
+        self._inflight: Optional[asyncio.Task] = None
+        self._inflight_key: Optional[Hashable] = None
+
+    async def get(self, key: Hashable = None) -> T:
+        if key == self._key and self._loaded_at is not None:
+            age = time.monotonic() - self._loaded_at
+            if age < self.ttl:
+                return self._value
+            if age < self.ttl + self.stale:
+                self._start_load(key)
+                return self._value
+        # Shielded so a caller giving up doesn't cancel the load for the others
+        return await asyncio.shield(self._start_load(key))
+
+    def invalidate(self):
+        # Drops the value, so the next call waits for a fresh load. A load
+        # already in flight may predate the change and is left out of it.
+        self._loaded_at = None
+        self._value = None
+        self._inflight = None
+        self._inflight_key = None
+
+    def _start_load(self, key: Hashable) -> asyncio.Task:
+        if self._inflight is None or self._inflight_key != key:
+            self._inflight = asyncio.create_task(self._refresh(key))
+            self._inflight.add_done_callback(self._log_failure)
+            self._inflight_key = key
+        return self._inflight
+
+    async def _refresh(self, key: Hashable) -> T:
+        task = asyncio.current_task()
+        try:
+            value = await self._load()
+            if self._inflight is task:
+                self._key = key
+                self._value = value
+                self._loaded_at = time.monotonic()
+            return value
+        finally:
+            if self._inflight is task:
+                self._inflight = None
+                self._inflight_key = None
+
+    @staticmethod
+    def _log_failure(task: asyncio.Task):
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Unable to refresh cached value: %s",
+                           task.exception())
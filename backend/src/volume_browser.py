@@ -0,0 +1,76 @@
+import re
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from src.modal_gateway import ModalGateway
+from src.ttl_cache import TTLCache
+
+SIZE_UNITS = {"B": 0, "KiB": 1, "MiB": 2, "GiB": 3,
+              "TiB": 4, "PiB": 5, "EiB": 6, "ZiB": 7}
+SIZE_PATTERN = re.compile(r"^\s*([\d.]+)\s*(\w+)\s*$")
+SORT_KEYS = {
+    "name": lambda entry: entry.get("Filename", "").lower(),
+    "modified": lambda entry: entry.get("Created/Modified") or "",
+    "size": lambda entry: parse_size(entry.get("Size")),
+}
+
+
+class VolumeBrowser:
+    """Directory listings of a Modal volume, cached per path.
+
+    Listings are fresh for `ttl` seconds and served stale for `stale` more
+    while they reload. Only the `max_paths` most recently browsed paths are
+    kept.
+    """
+
+    def __init__(self, gateway: ModalGateway, volume: str, ttl: float,
+                 stale: float, max_paths: int = 256):
+        self.gateway = gateway
+        self.volume = volume
+        self.ttl = ttl
+        self.stale = stale
+        self.max_paths = max_paths
+        self._listings: OrderedDict = OrderedDict()
+
+    async def list(self, path: str) -> List[Dict]:
+        cache = self._listings.get(path)
+        if cache is None:
+            cache = TTLCache(lambda: self.gateway.list_volume(self.volume, path),
+                             self.ttl, self.stale)
+            self._listings[path] = cache
+            if len(self._listings) > self.max_paths:
+                self._listings.popitem(last=False)
+        else:
+            self._listings.move_to_end(path)
+        return await cache.get()
+
+    def invalidate(self):
+        self._listings.clear()
+
+
+def paginate(entries: List[Dict], limit: Optional[int] = None,
+             cursor: Optional[str] = None, sort: Optional[str] = None,
+             descending: bool = False) -> Tuple[List[Dict], Optional[str]]:
+    # The cursor is the offset of the next page in the sorted listing.
+    # Returns the page and the cursor of the one after it, if any. Raises
+    # ValueError for a cursor that isn't an offset into the listing.
+    if sort is not None:
+        entries = sorted(entries, key=SORT_KEYS[sort], reverse=descending)
+    elif descending:
+        entries = entries[::-1]
+
+    start = int(cursor) if cursor else 0
+    if start < 0 or start > len(entries):
+        raise ValueError(f"cursor out of range: {cursor}")
+    if limit is None:
+        return entries[start:], None
+    end = start + limit
+    return entries[start:end], str(end) if end < len(entries) else None
+
+
+def parse_size(size: Optional[str]) -> float:
+    # Sizes come humanized by Modal, e.g. "1.5 GiB"
+    match = SIZE_PATTERN.match(size or "")
+    if match is None or match.group(2) not in SIZE_UNITS:
+        return 0.0
+    return float(match.group(1)) * 1024 ** SIZE_UNITS[match.group(2)]
@@ -46,9 +46,11 @@ export default function MachineLogs() {
       };
 
       const handleEvent = (event: MessageEvent) => {
+        // Each line carries the time the backend read it from the deploy
+        const { timestamp, message } = JSON.parse(event.data);
         pendingLogs.current.push({
-          timestamp: Date.now(),
-          message: event.data,
+          timestamp,
+          message,
           type: event.type as "stdout" | "stderr",
         });
       };
@@ -16,6 +16,9 @@ type FileSystemItem = {
 type LoaderData = {
   items: FileSystemItem[];
   currentPath: string;
+  cursor: string | null;
+  nextCursor: string | null;
+  total: number;
 };
 
 export const loader: LoaderFunction = async (args) => {
@@ -26,27 +29,53 @@ export const loader: LoaderFunction = async (args) => {
 
   const url = new URL(args.request.url);
   const currentPath = url.searchParams.get("path") || "";
+  const cursor = url.searchParams.get("cursor");
 
   try {
-    const items = await fetchModelsFileForPath(currentPath);
-    return json({ items, currentPath });
+    const { items, nextCursor, total } = await fetchModelsFileForPath(
+      currentPath,
+      cursor
+    );
+    return json({ items, currentPath, cursor, nextCursor, total });
   } catch (error) {
     console.error(`Error fetching list of models for ${currentPath}`, error);
     return json(
-      { items: [], currentPath, error: "Failed to fetch items" },
+      {
+        items: [],
+        currentPath,
+        cursor,
+        nextCursor: null,
+        total: 0,
+        error: "Failed to fetch items",
+      },
       { status: 500 }
     );
   }
 };
 
 export default function ModelsBrowser() {
-  const { items, currentPath } = useLoaderData<LoaderData>();
+  const { items, currentPath, cursor, nextCursor, total } =
+    useLoaderData<LoaderData>();
   const navigate = useNavigate();
 
   const navigateToFolder = (path: string) => {
     navigate(`?path=${encodeURIComponent(path)}`);
   };
 
+  const navigateToPage = (pageCursor: string | null) => {
+    const params = new URLSearchParams();
+    if (currentPath !== "") {
+      params.set("path", currentPath);
+    }
+    if (pageCursor) {
+      params.set("cursor", pageCursor);
+    }
+    navigate(`?${params.toString()}`);
+  };
+
+  const firstItem = Number(cursor ?? 0) + 1;
+  const lastItem = firstItem + items.length - 1;
+
   const navigateBack = () => {
     navigate(-1);
   };
@@ -172,6 +201,31 @@ export default function ModelsBrowser() {
                 </tbody>
               </table>
             </div>
+            {cursor || nextCursor ? (
+              <div className="flex items-center justify-between py-4">
+                <p className="text-sm text-primary/90">
+                  {firstItem}-{lastItem} of {total}
+                </p>
+                <div className="flex gap-2">
+                  <Button
+                    variant="outline"
+                    size="sm"
+                    disabled={!cursor}
+                    onClick={() => navigateToPage(null)}
+                  >
+                    First page
+                  </Button>
+                  <Button
+                    variant="outline"
+                    size="sm"
+                    disabled={!nextCursor}
+                    onClick={() => navigateToPage(nextCursor)}
+                  >
+                    Next page
+                  </Button>
+                </div>
+              </div>
+            ) : null}
           </div>
         </div>
       </div>
@@ -6,15 +6,26 @@ export type FileSystemItem = {
   Size?: string;
 };
 
+export type ModelsPage = {
+  items: FileSystemItem[];
+  // Cursor of the page after this one, null on the last page
+  nextCursor: string | null;
+  total: number;
+};
+
 export async function fetchModelsFileForPath(
-  path: string
-): Promise<FileSystemItem[]> {
+  path: string,
+  cursor?: string | null
+): Promise<ModelsPage> {
   const baseUrl = process.env.APP_BUILDER_API_BASE_URL;
 
   const url = new URL(`${baseUrl}/models`);
   if (path !== "") {
     url.searchParams.append("path", encodeURIComponent(path));
   }
+  if (cursor) {
+    url.searchParams.append("cursor", cursor);
+  }
 
   const response = await fetch(url.toString(), {
     method: "GET",
@@ -27,6 +38,10 @@ export async function fetchModelsFileForPath(
     throw new Error(`HTTP error! status: ${response.status}`);
   }
 
-  const data = await response.json();
-  return data;
+  const items: FileSystemItem[] = await response.json();
+  return {
+    items,
+    nextCursor: response.headers.get("X-Next-Cursor"),
+    total: Number(response.headers.get("X-Total-Count") ?? items.length),
+  };
 }